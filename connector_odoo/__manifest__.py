@@ -5,7 +5,7 @@
     "name": "Connector Odoo",
     "summary": """
         Base connector for Odoo To Odoo scenarios""",
-    "version": "16.0.2.0.0",
+    "version": "16.0.2.1.0",
     "website": "https://github.com/altinkaya-opensource/connector-odoo2odoo",
     "category": "Connector",
     "license": "AGPL-3",
@@ -67,7 +67,89 @@ class GenericAdapter(AbstractComponent):
     # _odoo_model = None
     # _admin_path = None
 
-    def search(
+    # Remote fields fetched by ``read``. ``None`` means every column of the
+    # remote record, which also transfers the big binary and HTML fields.
+    _read_fields = None
+    # Extend ``_read_fields`` with the source fields of the ``direct``
+    # mappings of the import mapper.
+    _read_fields_from_mapper = False
+    # Number of ids sent in each ``search_read`` of ``read_many``.
+    _read_chunk_size = 200
+    # Remote binary fields ``{remote field: local field}`` which are not read
+    # with the record, they are downloaded by a separate job when their
+    # fingerprint changed.
+    _lazy_binary_fields = {}
+
+    def _get_read_fields(self):
+        """Return the list of remote fields to fetch with ``read`` or
+        ``None`` to fetch all of them.
+
+        Inherit to add fields depending on the backend (e.g. version).
+        """
+        if self._read_fields is None and not self._read_fields_from_mapper:
+            return None
+        read_fields = {"id", "write_date"}
+        read_fields.update(self._read_fields or [])
+        if self._read_fields_from_mapper:
+            mapper = self.component(usage="import.mapper")
+            read_fields.update(
+                from_attr
+                for from_attr, __ in mapper.direct
+                if isinstance(from_attr, str)
+            )
+        read_fields.difference_update(self._get_lazy_binary_fields())
+        return sorted(read_fields)
+
+    def _get_lazy_binary_fields(self):
+        """Return the remote binary fields downloaded apart from the record
+        ``{remote field: local field}``.
+
+        Inherit to add fields depending on the backend (e.g. version).
+        """
+        return dict(self._lazy_binary_fields)
+
+    def read_binary_checksums(self, res_ids, fields):
+        """Read the checksums of the remote attachments storing the binary
+        fields of the records, without downloading them. The ids are sent
+        in chunks of ``_read_chunk_size`` ids.
+
+        :return: dict ``{res_id: {field: checksum}}`` with every id, a field
+                 without attachment is empty
+        """
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError as e:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            ) from e
+        res = {res_id: {} for res_id in res_ids}
+        res_ids = list(res)
+        for index in range(0, len(res_ids), self._read_chunk_size):
+            attachments = odoo_api.search(
+                model="ir.attachment",
+                domain=[
+                    ["res_model", "=", self._odoo_model],
+                    ["res_field", "in", list(fields)],
+                    ["res_id", "in", res_ids[index : index + self._read_chunk_size]],
+                ],
+                fields=["res_id", "res_field", "checksum"],
+            )
+            for attachment in attachments or []:
+                res[attachment["res_id"]][attachment["res_field"]] = attachment[
+                    "checksum"
+                ]
+        return res
+
+    def _get_search_domain(self, domain=None):
+        """Hook to extend the domain of the searches, e.g. with the
+        domain filters of the backend
+        :rtype: list
+        """
+        return list(domain or [])
+
+    def search_read(
         self,
         domain=None,
         model=None,
@@ -78,11 +160,47 @@ class GenericAdapter(AbstractComponent):
         context=None,
     ):
         """Search records according to some criterias
-        and returns a list of ids
+        and returns their information
+
+        When ``fields`` is not given, the fields declared by
+        :meth:`_get_read_fields` are fetched.
         :rtype: list
         """
+        ext_model = model or self._odoo_model
+        if fields is None and ext_model == self._odoo_model:
+            fields = self._get_read_fields()
+
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            )
+        return odoo_api.search(
+            model=ext_model,
+            fields=fields,
+            domain=self._get_search_domain(domain),
+            offset=offset,
+            limit=limit,
+            order=order,
+            context=context,
+            get_passive=self._get_passive,
+        )
 
+    def iter_search_read(
+        self, domain=None, model=None, fields=None, page_size=500, context=None
+    ):
+        """Search records according to some criterias and yield their
+        information, read page by page
+
+        When ``fields`` is not given, the fields declared by
+        :meth:`_get_read_fields` are fetched.
+        """
         ext_model = model or self._odoo_model
+        if fields is None and ext_model == self._odoo_model:
+            fields = self._get_read_fields()
 
         try:
             odoo_api = self.work.odoo_api
@@ -92,26 +210,53 @@ class GenericAdapter(AbstractComponent):
                 "OdooAPI instance to be able to use the "
                 "Backend Adapter."
             )
+        return odoo_api.iter_search_read(
+            model=ext_model,
+            domain=self._get_search_domain(domain),
+            fields=fields,
+            page_size=page_size,
+            context=context,
+            get_passive=self._get_passive,
+        )
+
+    def search(
+        self,
+        domain=None,
+        model=None,
+        offset=0,
+        limit=None,
+        order=None,
+        fields=None,
+        context=None,
+    ):
+        """Search records according to some criterias
+        and returns a list of ids
+        :rtype: list
+        """
         return [
             q["id"]
-            for q in odoo_api.search(
-                model=ext_model,
-                fields=fields or ["id"],
-                domain=domain or [],
+            for q in self.search_read(
+                domain=domain,
+                model=model,
                 offset=offset,
                 limit=limit,
                 order=order,
+                fields=fields or ["id"],
                 context=context,
-                get_passive=self._get_passive,
             )
         ]
 
     # pylint: disable=W8106,W0622
-    def read(self, res_id, model=None, context=None):
+    def read(self, res_id, model=None, context=None, fields=None):
         """Returns the information of a record
+
+        When ``fields`` is not given, the fields declared by
+        :meth:`_get_read_fields` are fetched.
         :rtype: dict
         """
         ext_model = model or self._odoo_model
+        if fields is None and ext_model == self._odoo_model:
+            fields = self._get_read_fields()
         try:
             odoo_api = self.work.odoo_api
         except AttributeError:
@@ -124,6 +269,33 @@ class GenericAdapter(AbstractComponent):
         return odoo_api.browse(
             model=ext_model,
             res_id=res_id,
+            fields=fields,
+            context=context,
+            get_passive=self._get_passive,
+        )
+
+    def read_many(self, res_ids, model=None, context=None, fields=None):
+        """Returns the information of several records, fetched in chunks
+        of ``_read_chunk_size`` ids
+        :rtype: dict
+        """
+        ext_model = model or self._odoo_model
+        if fields is None and ext_model == self._odoo_model:
+            fields = self._get_read_fields()
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError as e:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            ) from e
+
+        return odoo_api.read_many(
+            model=ext_model,
+            ids=res_ids,
+            fields=fields,
+            chunk_size=self._read_chunk_size,
             context=context,
             get_passive=self._get_passive,
         )
@@ -151,3 +323,58 @@ class GenericAdapter(AbstractComponent):
                 "Backend Adapter."
             ) from e
         return odoo_api.write(res_id=res_id, model=ext_model, data=data)
+
+    def create_multi(self, vals_list):
+        """Create several records, returns their ids in the order of the
+        values. Odoo creates several records at once from version 12.0."""
+        ext_model = self._odoo_model
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError as e:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            ) from e
+        if not self.can_create_multi():
+            return [odoo_api.create(model=ext_model, data=data) for data in vals_list]
+        return odoo_api.create_multi(model=ext_model, vals_list=vals_list)
+
+    def iter_create_multi(self, vals_list):
+        """Generator of the creation of several records by chunks, see
+        :meth:`OdooAPI.iter_create_multi`"""
+        ext_model = self._odoo_model
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError as e:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            ) from e
+        if not self.can_create_multi():
+            for index, data in enumerate(vals_list):
+                yield index, [odoo_api.create(model=ext_model, data=data)]
+            return
+        yield from odoo_api.iter_create_multi(model=ext_model, vals_list=vals_list)
+
+    def can_create_multi(self):
+        """Odoo creates several records with one call from version 12.0"""
+        return self.backend_record.version not in ("10.0", "11.0")
+
+    def write_multi(self, ids_vals):
+        """Write several records, the records with the same values are
+        written by the same call
+
+        :param ids_vals: dict ``{res_id or tuple of ids: vals}``
+        """
+        ext_model = self._odoo_model
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError as e:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            ) from e
+        return odoo_api.write_multi(model=ext_model, ids_vals=ids_vals)
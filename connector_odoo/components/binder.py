@@ -6,6 +6,26 @@ from odoo.addons.component.core import Component
 from odoo import tools
 
 
+def get_binder_cache(cr):
+    """Return the cache of the binder lookups of the transaction.
+
+    ``bindings`` is keyed by ``(binding model, external id)`` and holds
+    ``{backend id: binding id}``, a ``False`` binding id being a lookup
+    without result.
+    """
+    return cr.cache.setdefault(
+        "connector_odoo_binder",
+        {"hits": 0, "misses": 0, "bindings": {}},
+    )
+
+
+def invalidate_binder_cache(cr, model_name, external_ids):
+    """Forget the cached lookups of the given external ids"""
+    bindings = get_binder_cache(cr)["bindings"]
+    for external_id in external_ids:
+        bindings.pop((model_name, tools.ustr(external_id)), None)
+
+
 class OdooModelBinder(Component):
     """Bind records and give odoo/odoo ids correspondence
 
@@ -19,6 +39,40 @@ class OdooModelBinder(Component):
     _name = "odoo.binder"
     _inherit = ["base.binder", "base.odoo.connector"]
 
+    def _search_binding_ids(self, backend, external_ids):
+        """Give the binding ids of the external ids on the backend
+
+        The bindings inheriting ``odoo.binding`` are read with a direct query
+        on their (backend_id, external_id) index, the others with a search.
+
+        :return: a dict ``{ustr(external_id): [binding ids]}``
+        """
+        if not backend:
+            return {}
+        if (
+            self._external_field == "external_id"
+            and self._backend_field == "backend_id"
+            and hasattr(self.model, "_get_binding_ids_by_external_id")
+        ):
+            found = self.model._get_binding_ids_by_external_id(
+                backend.id, external_ids
+            )
+            return {
+                tools.ustr(external_id): binding_ids
+                for external_id, binding_ids in found.items()
+            }
+        res = {}
+        for binding in self.model.with_context(active_test=False).search(
+            [
+                (self._external_field, "in", [tools.ustr(x) for x in external_ids]),
+                (self._backend_field, "=", backend.id),
+            ]
+        ):
+            res.setdefault(tools.ustr(binding[self._external_field]), []).append(
+                binding.id
+            )
+        return res
+
     def to_internal(self, external_id, unwrap=False):
         """
         INHERITED to use default_backend_id instead of backend_id
@@ -35,12 +89,21 @@ class OdooModelBinder(Component):
         """
         context = self.env.context
         default_backend_id = self.env.company.default_odoo_backend_id
-        bindings = self.model.with_context(active_test=False).search(
-            [
-                (self._external_field, "=", tools.ustr(external_id)),
-                (self._backend_field, "=", default_backend_id.id),
-            ]
+        cache = get_binder_cache(self.env.cr)
+        cached = cache["bindings"].setdefault(
+            (self.model._name, tools.ustr(external_id)), {}
         )
+        if default_backend_id.id in cached:
+            cache["hits"] += 1
+            bindings = self.model.browse(cached[default_backend_id.id])
+        else:
+            cache["misses"] += 1
+            binding_ids = self._search_binding_ids(
+                default_backend_id, [external_id]
+            ).get(tools.ustr(external_id), [])
+            bindings = self.model.browse(binding_ids)
+            if len(bindings) <= 1:
+                cached[default_backend_id.id] = bindings.id
         if not bindings:
             if unwrap:
                 return self.model.browse()[self._odoo_field]
@@ -51,6 +114,106 @@ class OdooModelBinder(Component):
         bindings = bindings.with_context(**context)
         return bindings
 
+    def to_internal_many(self, external_ids, unwrap=False):
+        """
+        Give the Odoo recordsets of several external IDs, the unknown ones
+        are searched with a single query.
+
+        :param external_ids: external IDs for which we want the Odoo IDs
+        :param unwrap: if True, returns the normal records
+                       else return the binding records
+        :return: a dict ``{external_id: recordset}`` in the order of
+                 ``external_ids``, with an empty recordset for the
+                 external IDs which are not mapped
+        :rtype: dict
+        :raise ValueError: an external ID has several bindings, like
+                           :meth:`to_internal`
+        """
+        context = self.env.context
+        default_backend_id = self.env.company.default_odoo_backend_id
+        cache = get_binder_cache(self.env.cr)
+        binding_ids = {}
+        missing_ids = []
+        for external_id in external_ids:
+            cached = cache["bindings"].get((self.model._name, tools.ustr(external_id)))
+            if cached and default_backend_id.id in cached:
+                cache["hits"] += 1
+                binding_ids[external_id] = cached[default_backend_id.id]
+            else:
+                missing_ids.append(external_id)
+        if missing_ids:
+            cache["misses"] += len(missing_ids)
+            found = self._search_binding_ids(default_backend_id, missing_ids)
+            for external_id in missing_ids:
+                found_ids = found.get(tools.ustr(external_id), [False])
+                if len(found_ids) > 1:
+                    self.model.browse(found_ids).ensure_one()
+                binding_id = found_ids[0]
+                binding_ids[external_id] = binding_id
+                cache["bindings"].setdefault(
+                    (self.model._name, tools.ustr(external_id)), {}
+                )[default_backend_id.id] = binding_id
+
+        bindings = {
+            binding.id: binding
+            for binding in self.model.browse(
+                [binding_id for binding_id in binding_ids.values() if binding_id]
+            ).with_context(**context)
+        }
+        empty = self.model.browse().with_context(**context)
+        result = {}
+        for external_id in external_ids:
+            binding = bindings.get(binding_ids[external_id], empty)
+            result[external_id] = binding[self._odoo_field] if unwrap else binding
+        return result
+
+    def to_external_many(self, records, wrap=False):
+        """
+        Give the external IDs of several records with a single query.
+
+        :param records: binding records, or normal records when ``wrap``
+                        is True
+        :param wrap: if True, the records are normal records and their
+                     bindings on the backend are searched
+        :return: a dict ``{record id: external_id}`` in the order of
+                 ``records``, with ``None`` for the records which are not
+                 bound
+        :rtype: dict
+        """
+        if wrap:
+            bindings = self.model.with_context(active_test=False).search(
+                [
+                    (self._odoo_field, "in", records.ids),
+                    (self._backend_field, "=", self.backend_record.id),
+                ]
+            )
+            external_ids = {
+                binding[self._odoo_field].id: binding[self._external_field]
+                for binding in bindings
+            }
+        else:
+            external_ids = {
+                binding.id: binding[self._external_field] for binding in records
+            }
+        return {
+            record.id: external_ids.get(record.id) or None for record in records
+        }
+
+    def bind(self, external_id, binding):
+        """INHERITED to keep the lookup cache up to date"""
+        if isinstance(binding, int):
+            binding = self.model.browse(binding)
+        invalidate_binder_cache(
+            self.env.cr, self.model._name, [external_id, binding[self._external_field]]
+        )
+        return super(OdooModelBinder, self).bind(external_id, binding)
+
+    def get_cache_stats(self):
+        """Return the hits and misses of the lookup cache of the
+        transaction"""
+        cache = get_binder_cache(self.env.cr)
+        return {"hits": cache["hits"], "misses": cache["misses"]}
+
     def wrap_binding(self, regular, browse=False):
         """For a normal record, gives the binding record.
 
@@ -35,6 +35,9 @@ class OdooBaseExporter(AbstractComponent):
         super(OdooBaseExporter, self).__init__(working_context)
         self.binding = None
         self.external_id = None
+        # ``{external id: record with its write_date or None}`` read
+        # beforehand for the whole batch by the bulk exports
+        self._remote_records = None
 
     def _must_skip(self):
         """Base method to check if the export should be skipped."""
@@ -69,7 +72,17 @@ class OdooBaseExporter(AbstractComponent):
         sync = self.binding.sync_date
         if not sync:
             return True
-        record = self.backend_adapter.read(self.external_id)
+        if self.external_id in (self._remote_records or {}):
+            # Read with the other records of a bulk export
+            record = self._remote_records[self.external_id]
+            if record is None:
+                raise IDMissingInBackend(
+                    "ID {} not found in backend".format(self.external_id)
+                )
+        else:
+            record = self.backend_adapter.read(
+                self.external_id, fields=["write_date"]
+            )
         if not record.get("write_date"):
             # in rare case it can be empty, in doubt, import it
             return True
@@ -84,19 +97,8 @@ class OdooBaseExporter(AbstractComponent):
         if self.backend_record.no_export:
             return _("Nothing to export. (no export flag on connector)")
 
-        self.binding = binding
-        self.external_id = self.binder.to_external(self.binding, wrap=False)
-
-        if self._must_skip():
+        if not self._start_run(binding):
             return _("Export skipped.")
-
-        try:
-            should_import = self._should_import()
-        except IDMissingInBackend:
-            self.external_id = None
-            should_import = False
-        if should_import:
-            self._delay_import()
         result = self._run(*args, **kwargs)
 
         self.binder.bind(self.external_id, self.binding)
@@ -109,6 +111,27 @@ class OdooBaseExporter(AbstractComponent):
         self._after_export()
         return result
 
+    def _start_run(self, binding):
+        """Set the binding to export and delay its import when it is more
+        recent in Odoo.
+
+        :return: False when the export is skipped
+        """
+        self.binding = binding
+        self.external_id = self.binder.to_external(self.binding, wrap=False)
+
+        if self._must_skip():
+            return False
+
+        try:
+            should_import = self._should_import()
+        except IDMissingInBackend:
+            self.external_id = None
+            should_import = False
+        if should_import:
+            self._delay_import()
+        return True
+
 
 class BatchExporter(AbstractComponent):
     """The role of a BatchExporter is to search for a list of
@@ -134,7 +157,17 @@ class DelayedBatchExporter(AbstractComponent):
     _inherit = "odoo.batch.exporter"
 
     def _export_record(self, external_id, job_options=None, **kwargs):
-        """Delay the import of the records"""
+        """Delay the import of the records
+
+        The models exporting through ``odoo.export.outbox`` have no export
+        job per record, ``job_options`` can't be given for them.
+        """
+        if self.model._use_export_outbox:
+            assert not job_options, "The outbox exports have no job options"
+            self.env["odoo.export.outbox"].add(
+                external_id, self.backend_record, kwargs.get("fields")
+            )
+            return
         delayable = external_id.with_delay(
             channel=self.model._unique_channel_name,
             priority=self.model._priority,
@@ -160,6 +193,10 @@ class OdooExporter(AbstractComponent):
     _name = "odoo.exporter"
     _inherit = "odoo.base.exporter"
 
+    # The outbox sends the data of the records of this model to Odoo with
+    # bulk create and write calls, see :meth:`prepare_run`
+    _bulk_export = False
+
     def __init__(self, working_context):
         super(OdooExporter, self).__init__(working_context)
         self.binding = None
@@ -394,6 +431,43 @@ class OdooExporter(AbstractComponent):
 
     def _run(self, fields=None):
         """Flow of the synchronization, implemented in inherited classes"""
+        method, record = self._prepare_export(fields=fields)
+        if not record:
+            return _("Nothing to export.")
+        if method == "write":
+            self._update(record)
+        elif method == "create":
+            self.external_id = self._create(record)
+        return _("Record exported with ID %s on Odoo.") % self.external_id
+
+    def prepare_run(self, binding, fields=None, remote_records=None):
+        """Run the export of the binding up to the call to Odoo, the bulk
+        exports send the data of several bindings together then call
+        :meth:`finish_run` on each exporter.
+
+        :param remote_records: ``{external id: record or None}`` with the
+                               ``write_date`` of the records of the batch
+                               on Odoo, so they are not read one by one
+        :return: tuple ``(method, data)`` as :meth:`_prepare_export`, or
+                 None when the export is skipped
+        """
+        self._remote_records = remote_records
+        if self.backend_record.no_export or not self._start_run(binding):
+            return None
+        return self._prepare_export(fields=fields)
+
+    def finish_run(self):
+        """Bind the binding exported in bulk, the caller commits then runs
+        :meth:`_after_export`"""
+        self.binder.bind(self.external_id, self.binding)
+
+    def _prepare_export(self, fields=None):
+        """Run the flow of the export up to the data to send to Odoo.
+
+        :return: tuple ``(method, data)``, the method is ``"write"``,
+                 ``"create"`` or None when the data already gives the
+                 external id
+        """
         assert self.binding
 
         if not self.external_id:
@@ -421,16 +495,9 @@ class OdooExporter(AbstractComponent):
         # 0 is a special value for external_id, it means that the
         # record is not yet exported
         if self.external_id and self.external_id != 0:
-            record = self._update_data(map_record, fields=fields)
-            if not record:
-                return _("Nothing to export.")
-            self._update(record)
-        else:
-            record = self._create_data(map_record, fields=fields)
-            if not record:
-                return _("Nothing to export.")
-            if "external_id" in record and record["external_id"]:
-                self.external_id = record["external_id"]
-            else:
-                self.external_id = self._create(record)
-        return _("Record exported with ID %s on Odoo.") % self.external_id
+            return "write", self._update_data(map_record, fields=fields)
+        record = self._create_data(map_record, fields=fields)
+        if record and "external_id" in record and record["external_id"]:
+            self.external_id = record["external_id"]
+            return None, record
+        return "create", record
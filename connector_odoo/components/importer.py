@@ -14,19 +14,47 @@ are already bound, to update the last sync date.
 
 """
 
+import hashlib
+import itertools
+import json
 import logging
+import re
+import time
+from contextlib import contextmanager
 
-from odoo import _, fields
-from odoo.tools import frozendict
+from odoo import _, fields, models
+from odoo.tools import float_compare, frozendict
 
 from odoo.addons.component.core import AbstractComponent
+from odoo.addons.connector.database import pg_try_advisory_xact_lock
 from odoo.addons.connector.exception import IDMissingInBackend, RetryableJobError
+from odoo.addons.connector_odoo.components.binder import (
+    get_binder_cache,
+    invalidate_binder_cache,
+)
+from odoo.addons.queue_job.delay import chain, group
 from odoo.addons.queue_job.exception import NothingToDoJob
 from psycopg2.extras import Json
 
 _logger = logging.getLogger(__name__)
 
 
+def identity_import_record(job_):
+    """Identity of the ``import_record`` jobs: ``identity_exact`` with only
+    the write date of the prefetched ``odoo_record`` instead of its data, a
+    job waiting to import the same version of the record is the same job"""
+    kwargs = dict(job_.kwargs)
+    if kwargs.get("odoo_record"):
+        kwargs["odoo_record"] = kwargs["odoo_record"].get("write_date")
+    hasher = hashlib.sha1()
+    hasher.update(job_.model_name.encode("utf-8"))
+    hasher.update(job_.method_name.encode("utf-8"))
+    hasher.update(str(sorted(job_.recordset.ids)).encode("utf-8"))
+    hasher.update(str(job_.args).encode("utf-8"))
+    hasher.update(str(sorted(kwargs.items())).encode("utf-8"))
+    return hasher.hexdigest()
+
+
 class OdooImporter(AbstractComponent):
     """Base importer for Odoo"""
 
@@ -34,6 +62,16 @@ class OdooImporter(AbstractComponent):
     _inherit = ["base.importer", "base.odoo.connector"]
     _usage = "record.importer"
 
+    # When True, only the mapped values which differ from the current values
+    # of the binding are written on update.
+    _write_changed_fields_only = False
+    # Fields read on Odoo left out of the hash of the import, they change
+    # on every write whatever the content
+    _sync_hash_ignored_fields = ("write_date", "__last_update")
+    # When True, :meth:`_after_import` runs even when the hash of the import
+    # did not change, for the importers linking records imported apart
+    _after_import_when_unchanged = False
+
     def __init__(self, work_context):
         super(OdooImporter, self).__init__(work_context)
         self.external_id = None
@@ -100,6 +138,13 @@ class OdooImporter(AbstractComponent):
         """
         if not external_id:
             return
+        registry = getattr(self.work, "dependency_registry", None)
+        if registry is not None:
+            key = (binding_model, external_id, force)
+            if key in registry["visited"]:
+                registry["skipped"] += 1
+                return
+            registry["visited"].add(key)
         binder = self.binder_for(binding_model)
         binding = binder.to_internal(external_id)
         if force or not (binding and self._is_uptodate(binding)):
@@ -202,12 +247,91 @@ class OdooImporter(AbstractComponent):
     def _update(self, binding, data):
         """Update an Odoo record"""
         context = {**{"connector_no_export": True}, **self._get_context()}
+        if self._write_changed_fields_only:
+            changed = self._get_changed_values(binding.with_context(context), data)
+            _logger.info(
+                "%d: %s of %s fields unchanged, not written",
+                binding,
+                len(data) - len(changed),
+                len(data),
+            )
+            data = changed
+            if not data:
+                return
         # Todo yigit: we've added sudo here. maybe we should avoid sudo and
         # rearrange the permissions
         binding.with_context(context).sudo().write(data)
         _logger.info("%d updated from Odoo %s", binding, self.external_id)
         return
 
+    def _get_changed_values(self, binding, data):
+        """Return the values of ``data`` which differ from the ones of the
+        binding"""
+        return {
+            name: value
+            for name, value in data.items()
+            if name not in binding._fields
+            or not self._is_same_value(binding, binding._fields[name], value)
+        }
+
+    def _is_same_value(self, binding, field, value):
+        """Compare a mapped value with the current value of the field, in the
+        format of the field type"""
+        if field.type == "binary":
+            # Binary contents are not read to be compared, the size is read
+            # instead of the content to know if the field is set
+            return not value and not binding.with_context(bin_size=True)[field.name]
+        current = binding[field.name]
+        if isinstance(value, models.BaseModel):
+            value = value.ids if field.type in ("one2many", "many2many") else value.id
+        if field.type == "many2one":
+            return (value or False) == current.id
+        if field.type in ("one2many", "many2many"):
+            ids = self._get_command_ids(value)
+            return ids is not None and ids == set(current.ids)
+        if field.type in ("float", "monetary"):
+            digits = field.get_digits(binding.env) if field.type == "float" else None
+            return not float_compare(
+                value or 0.0,
+                current or 0.0,
+                precision_digits=digits[1] if digits else 6,
+            )
+        if field.type == "integer":
+            return (value or 0) == (current or 0)
+        if field.type == "boolean":
+            return bool(value) == bool(current)
+        if field.type == "html":
+            return self._normalize_html(value) == self._normalize_html(current)
+        # to_date and to_datetime return None for an empty value
+        if field.type == "date":
+            return (fields.Date.to_date(value) or False) == (current or False)
+        if field.type == "datetime":
+            return (fields.Datetime.to_datetime(value) or False) == (current or False)
+        return (value or False) == (current or False)
+
+    def _get_command_ids(self, value):
+        """Return the ids set by a list of x2many commands, or None when the
+        commands don't replace the whole relation. An empty value is an
+        empty relation."""
+        if not value:
+            return set()
+        ids = None
+        for command in value:
+            if isinstance(command, int):
+                ids = (ids or set()) | {command}
+            elif command[0] == 6:
+                ids = set(command[2])
+            elif command[0] == 5:
+                ids = set()
+            elif command[0] == 4 and ids is not None:
+                ids.add(command[1])
+            else:
+                return None
+        return ids
+
+    def _normalize_html(self, value):
+        return re.sub(r">\s+<", "><", str(value or "").strip())
+
     def _translate_fields(self, binding):
         """
         Update translations for translatable fields with Odoo 16.0's new
@@ -254,6 +378,10 @@ class OdooImporter(AbstractComponent):
         context = {**{"connector_no_export": True}, **self._get_context()}
         self.env.context = frozendict(self.env.context, **context)
         self.env.flush_all()
+        commit_batch = getattr(self.work, "commit_batch", None)
+        if commit_batch and commit_batch["active"]:
+            # The batch importer commits several records at once
+            return True
         self.env.cr.commit()
         return True
 
@@ -279,6 +407,99 @@ class OdooImporter(AbstractComponent):
             return False
         return force
 
+    def _get_binary_fingerprints(self):
+        """Return the fingerprints of the remote lazy binary fields
+        ``{remote field: fingerprint}``: the checksums of the remote
+        attachments storing them, prefetched by chunk by the batch importers
+        or read for this record.
+
+        Inherit when the record is read with a checksum of its content.
+        """
+        lazy_fields = list(self.backend_adapter._get_lazy_binary_fields())
+        checksums = self.work.binary_checksums.setdefault(self.work.model_name, {})
+        if self.external_id not in checksums:
+            checksums.update(
+                self.backend_adapter.read_binary_checksums(
+                    [self.external_id], lazy_fields
+                )
+            )
+        return {
+            field: checksums[self.external_id].get(field) or False
+            for field in lazy_fields
+        }
+
+    def _get_stored_binary_fingerprints(self, binding):
+        """Return the fingerprints of the binary fields of the last download"""
+        return binding.binary_fingerprints or {}
+
+    def _delay_binary_import(self, binding):
+        """Delay the download of the lazy binary fields which changed on Odoo"""
+        if not self.backend_adapter._get_lazy_binary_fields():
+            return
+        stored = self._get_stored_binary_fingerprints(binding)
+        changed = {
+            field: fingerprint
+            for field, fingerprint in self._get_binary_fingerprints().items()
+            if field not in stored or stored[field] != fingerprint
+        }
+        if changed:
+            self.model.with_delay(
+                channel=self.model._binary_channel_name,
+                priority=self.model._priority + 10,
+                max_retries=10,
+            ).import_binary_fields(self.backend_record, self.external_id, changed)
+
+    def import_binary_fields(self, external_id, fingerprints):
+        """Download the binary fields of the record
+
+        :param fingerprints: ``{remote field: fingerprint}`` of the fields
+        """
+        self.external_id = external_id
+        binding = self._get_binding()
+        if not binding:
+            return _("The record is not imported yet.")
+        lazy_fields = self.backend_adapter._get_lazy_binary_fields()
+        data = self.backend_adapter.read(external_id, fields=list(fingerprints))
+        vals = {
+            lazy_fields[field]: data.get(field) or False
+            for field in fingerprints
+            if field in lazy_fields
+        }
+        vals["binary_fingerprints"] = dict(
+            binding.binary_fingerprints or {}, **fingerprints
+        )
+        self._update(binding, vals)
+        return _("Binary fields downloaded: %s") % ", ".join(fingerprints)
+
+    def _get_sync_hash(self, record):
+        """Return a stable hash of the mapped values and of all the fields
+        read on Odoo, translations included. The fields only used by
+        :meth:`_after_import` (lines, attachments...) are read too, so a
+        change of them changes the hash."""
+        odoo_record = {
+            key: value
+            for key, value in self.odoo_record.items()
+            if key not in self._sync_hash_ignored_fields
+        }
+        content = json.dumps([record, odoo_record], sort_keys=True, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _skip_unchanged(self, binding):
+        """Neither the mapped values nor the fields read on Odoo changed
+        since the last import, only update the sync date of the binding"""
+        _logger.info(
+            "({}: {}) Unchanged, not updated".format(
+                self.work.model_name, self.external_id
+            )
+        )
+        self.binder.bind(self.external_id, binding)
+        self._delay_binary_import(binding)
+        self._commit()
+        if self._after_import_when_unchanged:
+            self._after_import(binding, force=False)
+            self._commit()
+        return _("Unchanged.")
+
     def _init_import(self, binding, external_id):
         """Hook called at before read data from backend"""
         return True
@@ -290,13 +511,16 @@ class OdooImporter(AbstractComponent):
         """
         return True
 
-    def set_lock(self, external_id):
-        lock_name = "import({}, {}, {}, {})".format(
+    def _get_lock_name(self, external_id):
+        return "import({}, {}, {}, {})".format(
             self.backend_record._name,
             self.backend_record.id,
             self.work.model_name,
             external_id,
         )
+
+    def set_lock(self, external_id):
+        lock_name = self._get_lock_name(external_id)
         _logger.info("Initializating {}".format(lock_name))
         # Keep a lock on this import until the transaction is committed
         # The lock is kept since we have detected that the informations
@@ -304,10 +528,13 @@ class OdooImporter(AbstractComponent):
         self.advisory_lock_or_retry(lock_name)
         _logger.info("Resource {} locked".format(lock_name))
 
-    def run(self, external_id, force=False):
+    def run(self, external_id, force=False, odoo_record=None):
         """Run the synchronization
 
         :param external_id: identifier of the record on Odoo
+        :param odoo_record: data of the record already fetched from Odoo,
+                            e.g. by a batch importer. When given, the
+                            record is not read again.
         """
         force = self._check_force_available(force=force)
         self.external_id = external_id
@@ -322,7 +549,7 @@ class OdooImporter(AbstractComponent):
             return _("This record must not be imported.")
 
         try:
-            self.odoo_record = self._get_odoo_data()
+            self.odoo_record = odoo_record or self._get_odoo_data()
         except (IDMissingInBackend, ValueError):
             return _("Record does no longer exist in Odoo")
 
@@ -349,12 +576,18 @@ class OdooImporter(AbstractComponent):
 
         _logger.info("Mapping data ({}: {})".format(self.work.model_name, external_id))
         map_record = self._map_data()
+        unchanged = False
         try:
             if binding:
                 record = self._update_data(map_record, binding=binding)
-                self._update(binding, record)
+                sync_hash = self._get_sync_hash(record)
+                unchanged = binding.sync_hash == sync_hash
+                if not unchanged:
+                    record["sync_hash"] = sync_hash
+                    self._update(binding, record)
             else:
                 record = self._create_data(map_record)
+                record["sync_hash"] = self._get_sync_hash(record)
                 binding = self._create(record)
         except Exception as e:
             _logger.error(
@@ -368,6 +601,8 @@ class OdooImporter(AbstractComponent):
                 ),
                 seconds=5,
             )
+        if unchanged:
+            return self._skip_unchanged(binding)
 
         _logger.info(
             "Translating Fields ({}: {})".format(self.work.model_name, external_id)
@@ -376,6 +611,7 @@ class OdooImporter(AbstractComponent):
 
         _logger.info("Binding ({}: {})".format(self.work.model_name, external_id))
         self.binder.bind(self.external_id, binding)
+        self._delay_binary_import(binding)
 
         _logger.info(
             "Check if after import process must be executed ({}: {})".format(
@@ -401,6 +637,19 @@ class BatchImporter(AbstractComponent):
     _inherit = ["base.importer", "base.odoo.connector"]
     _usage = "batch.importer"
 
+    # When True, the records are read with the search and given to the
+    # record importers, which don't have to read them again.
+    _prefetch_records = False
+    # Number of records of each page of the search.
+    _search_page_size = 500
+    # When True, the records whose binding was synchronized after their last
+    # update on Odoo are dropped before being imported, unless forced.
+    _filter_uptodate = False
+    # The records imported in the batch job are committed together every
+    # ``_commit_every`` records or ``_commit_interval`` milliseconds.
+    _commit_every = 50
+    _commit_interval = 2000
+
     def set_lock(self):
         lock_name = "import({}, {}, {})".format(
             self.backend_record._name,
@@ -416,17 +665,202 @@ class BatchImporter(AbstractComponent):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        record_ids = self.backend_adapter.search(domain)
-        for record_id in record_ids:
-            self._import_record(record_id, force=force)
+        filter_uptodate = self._filter_uptodate and not force
+        if self._prefetch_records and self.work.collected_ids is None:
+            fields = None
+        elif filter_uptodate:
+            fields = ["id", "write_date"]
+        else:
+            fields = ["id"]
+        count = 0
+        for records in self._iter_search_pages(domain, fields):
+            count += len(records)
+            _logger.info(
+                "search for %s %s returned %s items (%s so far)",
+                self.work.model_name,
+                domain,
+                len(records),
+                count,
+            )
+            if filter_uptodate:
+                records = self._drop_uptodate(records)
+            self._import_records(records, force=force)
+
+    def _import_records(self, records, force=False):
+        """Import a page of records returned by the search"""
+        for record in records:
+            odoo_record = record if self._prefetch_records else None
+            self._import_record(record["id"], force=force, odoo_record=odoo_record)
+
+    def _iter_search_pages(self, domain, fields):
+        """Yield the records of the search by lists of ``_search_page_size``"""
+        records = self.backend_adapter.iter_search_read(
+            domain, fields=fields, page_size=self._search_page_size
+        )
+        while True:
+            page = list(itertools.islice(records, self._search_page_size))
+            if not page:
+                break
+            yield page
+
+    def _drop_uptodate(self, records):
+        """Remove the records already up-to-date in Odoo, same rule as
+        :meth:`OdooImporter._is_uptodate` but with one query for all of them
+
+        :param records: dicts with at least the ``id`` and ``write_date``
+        """
+        uptodate_ids = self.model._get_uptodate_external_ids(
+            self.backend_record.id,
+            [(record["id"], record.get("write_date")) for record in records],
+        )
+        if uptodate_ids:
+            _logger.info(
+                "%s %s records are already up-to-date, skipped",
+                len(uptodate_ids),
+                self.work.model_name,
+            )
+        return [record for record in records if record["id"] not in uptodate_ids]
 
-    def _import_record(self, external_id, force=False):
+    def _import_record(self, external_id, force=False, odoo_record=None):
         """Import a record directly or delay the import of the record.
 
         Method to implement in sub-classes.
         """
         raise NotImplementedError
 
+    def _collect_records(self, external_ids):
+        """Keep the ids for :meth:`get_import_delayable` instead of importing
+        them, when the batch importer is run to collect them
+
+        :return: True if the ids are collected
+        """
+        collected_ids = self.work.collected_ids
+        if collected_ids is None:
+            return False
+        collected_ids.extend(external_ids)
+        return True
+
+    def get_import_delayable(self, domain=None, force=False):
+        """Search the records to import like :meth:`run` and return the
+        delayable importing them by chunks, to put in a chain.
+
+        :return: a group of ``import_record_chunk`` jobs, None when there is
+                 nothing to import
+        """
+        with self.backend_record.work_on(
+            self.work.model_name, collected_ids=[]
+        ) as work:
+            work.component(usage="batch.importer").run(domain=domain, force=force)
+            external_ids = list(dict.fromkeys(work.collected_ids))
+        _logger.info(
+            "%s %s records to import in the chain",
+            len(external_ids),
+            self.work.model_name,
+        )
+        return self._get_chunk_delayable(external_ids, force=force)
+
+    def _get_chunk_delayable(self, external_ids, force=False, **kwargs):
+        """Group the ``import_record_chunk`` jobs of the records, the jobs
+        are retried for the failed records while they have retries left, so
+        the next jobs of the chain find them imported"""
+        if not external_ids:
+            return None
+        chunk_size = self.model._import_chunk_size
+        return group(
+            *[
+                self.model.delayable(
+                    channel=self.model._unique_channel_name,
+                    priority=self.model._priority,
+                    max_retries=10,
+                ).import_record_chunk(
+                    self.backend_record,
+                    external_ids[index : index + chunk_size],
+                    force=force,
+                    in_chain=True,
+                    **kwargs,
+                )
+                for index in range(0, len(external_ids), chunk_size)
+            ]
+        )
+
+    def import_chunk(self, external_ids, force=False):
+        """Import the records one by one in the current work context, they
+        are committed by batches.
+
+        :return: the external ids of the records that failed
+        """
+        odoo_records = self.backend_adapter.read_many(external_ids)
+        self._prefetch_binary_checksums(external_ids)
+        failed_ids = []
+        with self._batched_commits():
+            for external_id in external_ids:
+                if not self._import_in_savepoint(
+                    external_id,
+                    force=force,
+                    odoo_record=odoo_records.get(external_id),
+                ):
+                    failed_ids.append(external_id)
+        return failed_ids
+
+    def _prefetch_binary_checksums(self, external_ids):
+        """Read the checksums of the lazy binary fields of the records at
+        once, for the record importers comparing them with the stored ones"""
+        lazy_fields = list(self.backend_adapter._get_lazy_binary_fields())
+        if not lazy_fields or not external_ids:
+            return
+        self.work.binary_checksums.setdefault(self.work.model_name, {}).update(
+            self.backend_adapter.read_binary_checksums(external_ids, lazy_fields)
+        )
+
+    @contextmanager
+    def _batched_commits(self):
+        """The record importers run in this context don't commit, the
+        records are committed together by :meth:`_import_in_savepoint`"""
+        commit_batch = self.work.commit_batch
+        commit_batch.update(active=True, count=0, started=time.monotonic())
+        try:
+            yield
+        finally:
+            commit_batch["active"] = False
+        self._commit_batch()
+
+    def _commit_batch(self):
+        self.env.flush_all()
+        self.env.cr.commit()  # pylint: disable=invalid-commit
+        self.work.commit_batch.update(count=0, started=time.monotonic())
+
+    def _import_in_savepoint(self, external_id, force=False, odoo_record=None):
+        """Import the record in the current work context, inside a savepoint
+        so a failure only loses the changes of this record.
+
+        :return: True if the record was imported
+        """
+        importer = self.component(usage="record.importer")
+        try:
+            with self.env.cr.savepoint():
+                importer.set_lock(external_id)
+                importer.run(external_id, force=force, odoo_record=odoo_record)
+        except Exception as e:
+            # The dependencies imported with the record are rolled back too
+            self.work.dependency_registry["visited"].clear()
+            get_binder_cache(self.env.cr)["bindings"].clear()
+            _logger.warning(
+                "Import of %s(%s) failed in batch: %s",
+                self.work.model_name,
+                external_id,
+                e,
+            )
+            return False
+        commit_batch = self.work.commit_batch
+        commit_batch["count"] += 1
+        elapsed = (time.monotonic() - commit_batch["started"]) * 1000
+        if (
+            commit_batch["count"] >= self._commit_every
+            or elapsed >= self._commit_interval
+        ):
+            self._commit_batch()
+        return True
+
 
 class DirectBatchImporter(AbstractComponent):
     """Import the records directly, without delaying the jobs."""
@@ -434,9 +868,22 @@ class DirectBatchImporter(AbstractComponent):
     _name = "odoo.direct.batch.importer"
     _inherit = "odoo.batch.importer"
 
-    def _import_record(self, external_id, force=False):
-        """Import the record directly"""
-        self.model.import_record(self.backend_record, external_id, force=force)
+    def run(self, domain=None, force=False):
+        """Run the synchronization, committing the records by batches"""
+        with self._batched_commits():
+            return super(DirectBatchImporter, self).run(domain=domain, force=force)
+
+    def _import_record(self, external_id, force=False, odoo_record=None):
+        """Import the record directly, a failing record is delayed again on
+        its own"""
+        if self._collect_records([external_id]):
+            return
+        if not self._import_in_savepoint(
+            external_id, force=force, odoo_record=odoo_record
+        ):
+            self.model.delayed_import_record(
+                self.backend_record, external_id, force=force
+            )
 
 
 class DelayedBatchImporter(AbstractComponent):
@@ -446,11 +893,328 @@ class DelayedBatchImporter(AbstractComponent):
     _inherit = "odoo.batch.importer"
 
     def _import_record(self, external_id, job_options=None, **kwargs):
-        """Delay the import of the records"""
+        """Delay the import of the records
+
+        A prefetched ``odoo_record`` is stored in the job arguments, so keep
+        the prefetch for the models with a compact read field profile. It is
+        not part of the identity of the job, only its write date.
+        """
+        if self._collect_records([external_id]):
+            return
+        if kwargs.get("odoo_record") is None:
+            kwargs.pop("odoo_record", None)
         delayable = self.model.with_delay(
             channel=self.model._unique_channel_name,
             priority=self.model._priority,
             max_retries=10,
-            **job_options or {},
+            **dict({"identity_key": identity_import_record}, **job_options or {}),
         )
         delayable.import_record(self.backend_record, external_id, **kwargs)
+
+
+class ChunkedBatchImporter(AbstractComponent):
+    """Delay the import of the records by chunks.
+
+    Each job imports ``_import_chunk_size`` records of the binding model in
+    the same work context, so they share the connection to Odoo. A failing
+    record does not stop the chunk, it is delayed again on its own.
+    """
+
+    _name = "odoo.chunked.batch.importer"
+    _inherit = "odoo.batch.importer"
+
+    def __init__(self, work_context):
+        super(ChunkedBatchImporter, self).__init__(work_context)
+        self._chunk = []
+
+    def run(self, domain=None, force=False):
+        """Run the synchronization"""
+        res = super(ChunkedBatchImporter, self).run(domain=domain, force=force)
+        self._delay_chunk(force=force)
+        return res
+
+    def _import_record(self, external_id, force=False, odoo_record=None):
+        """Add the record to the current chunk, the chunk job reads the
+        records again with a single ``read_many``"""
+        if self._collect_records([external_id]):
+            return
+        self._chunk.append(external_id)
+        if len(self._chunk) >= self.model._import_chunk_size:
+            self._delay_chunk(force=force)
+
+    def _delay_chunk(self, force=False, job_options=None):
+        if not self._chunk:
+            return
+        delayable = self.model.with_delay(
+            channel=self.model._unique_channel_name,
+            priority=self.model._priority,
+            max_retries=10,
+            **job_options or {},
+        )
+        delayable.import_record_chunk(self.backend_record, self._chunk, force=force)
+        self._chunk = []
+
+
+class BulkBatchImporter(AbstractComponent):
+    """Import the records page by page in the batch job.
+
+    The records of a page are mapped together, the new ones are created with
+    a single ``create`` and the updates sharing the same values are written
+    together. For the leaf models: the record importer hooks are called for
+    each record, but ``_import_dependencies`` runs before the bindings of the
+    page are created and ``_after_import`` once they all are.
+    """
+
+    _name = "odoo.bulk.batch.importer"
+    _inherit = "odoo.batch.importer"
+
+    _prefetch_records = True
+    _filter_uptodate = True
+
+    def run(self, domain=None, force=False):
+        """Run the synchronization, committing the records by pages"""
+        with self._batched_commits():
+            return super(BulkBatchImporter, self).run(domain=domain, force=force)
+
+    def _import_records(self, records, force=False):
+        """Import the page, the failed records are delayed on their own"""
+        if self._collect_records([record["id"] for record in records]):
+            return
+        for external_id in self._import_page(records, force=force):
+            self.model.delayed_import_record(
+                self.backend_record, external_id, force=force
+            )
+        self._commit_batch()
+
+    def import_chunk(self, external_ids, force=False):
+        """Import the records of the chunk as a page
+
+        :return: the external ids of the records that failed
+        """
+        odoo_records = self.backend_adapter.read_many(external_ids)
+        records = [
+            odoo_records[external_id]
+            for external_id in external_ids
+            if external_id in odoo_records
+        ]
+        with self._batched_commits():
+            return self._import_page(records, force=force)
+
+    def _import_page(self, records, force=False):
+        """Import the page at once, or record by record when it fails
+
+        :return: the external ids of the records that failed or are being
+                 imported by another job
+        """
+        records, locked_ids = self._lock_records(records)
+        try:
+            with self.env.cr.savepoint():
+                self._bulk_import(records, force=force)
+            return locked_ids
+        except Exception as e:
+            _logger.warning(
+                "Bulk import of %s %s records failed, importing them one by one: %s",
+                len(records),
+                self.work.model_name,
+                e,
+            )
+            self.work.dependency_registry["visited"].clear()
+            get_binder_cache(self.env.cr)["bindings"].clear()
+        return locked_ids + [
+            record["id"]
+            for record in records
+            if not self._import_in_savepoint(
+                record["id"], force=force, odoo_record=record
+            )
+        ]
+
+    def _lock_records(self, records):
+        """Take the lock of the record importer on each record of the page,
+        until the page is committed, so a concurrent import can't create the
+        same bindings
+
+        :return: tuple ``(records locked, ids locked by another import)``
+        """
+        importer = self.component(usage="record.importer")
+        locked = []
+        locked_ids = []
+        for record in records:
+            lock_name = importer._get_lock_name(record["id"])
+            if pg_try_advisory_xact_lock(self.env.cr, lock_name):
+                locked.append(record)
+            else:
+                locked_ids.append(record["id"])
+        if locked_ids:
+            _logger.info(
+                "%s %s records are being imported by another job, delayed",
+                len(locked_ids),
+                self.work.model_name,
+            )
+        return locked, locked_ids
+
+    def _bulk_import(self, records, force=False):
+        importer = self.component(usage="record.importer")
+        binder = self.binder
+        bindings = binder.to_internal_many([record["id"] for record in records])
+        sync_date = fields.Datetime.now()
+        to_create = []
+        to_write = {}
+        imported = []
+        unchanged = []
+        for record in records:
+            importer.external_id = record["id"]
+            importer.odoo_record = record
+            binding = importer._get_binding_with_data(bindings[record["id"]])
+            if importer._must_skip():
+                continue
+            importer._import_dependencies(force=force)
+            map_record = importer._map_data()
+            if binding:
+                vals = importer._update_data(map_record, binding=binding)
+                sync_hash = importer._get_sync_hash(vals)
+                if binding.sync_hash == sync_hash:
+                    vals = {}
+                    unchanged.append((record, binding))
+                else:
+                    vals["sync_hash"] = sync_hash
+                    imported.append((record, binding))
+                vals[binder._sync_date_field] = sync_date
+                key = json.dumps(vals, sort_keys=True, default=str)
+                to_write.setdefault(key, (vals, []))[1].append(binding.id)
+            else:
+                vals = importer._create_data(map_record)
+                vals["sync_hash"] = importer._get_sync_hash(vals)
+                vals.update(
+                    {
+                        binder._backend_field: self.backend_record.id,
+                        binder._external_field: record["id"],
+                        binder._sync_date_field: sync_date,
+                    }
+                )
+                to_create.append((record, vals))
+
+        context = {**{"connector_no_export": True}, **importer._get_context()}
+        model = self.model.sudo().with_context(context)
+        created = model.create([vals for __, vals in to_create])
+        # The lookups of the page cached them as unknown
+        invalidate_binder_cache(
+            self.env.cr, self.model._name, [record["id"] for record, __ in to_create]
+        )
+        imported += list(zip([record for record, __ in to_create], created))
+        for vals, binding_ids in to_write.values():
+            model.browse(binding_ids).write(vals)
+        for record, binding in imported:
+            importer.external_id = record["id"]
+            importer.odoo_record = record
+            importer._translate_fields(binding)
+            importer._after_import(binding, force=force)
+        if importer._after_import_when_unchanged:
+            for record, binding in unchanged:
+                importer.external_id = record["id"]
+                importer.odoo_record = record
+                importer._after_import(binding, force=False)
+        _logger.info(
+            "%s %s records created, %s updated in %s writes",
+            len(created),
+            self.work.model_name,
+            sum(len(binding_ids) for __, binding_ids in to_write.values()),
+            len(to_write),
+        )
+
+
+class HierarchyBatchImporter(AbstractComponent):
+    """Import the records of a self-referencing model level by level.
+
+    The ids and parents of the records are read first. The roots are
+    imported by chunks, then each level once the previous one is done, so
+    the record importers don't import the parents as dependencies. The
+    parent store is recomputed once at the end.
+    """
+
+    _name = "odoo.hierarchy.batch.importer"
+    _inherit = "odoo.chunked.batch.importer"
+
+    # Remote field referencing the parent record
+    _parent_field = "parent_id"
+
+    def run(self, domain=None, force=False):
+        """Run the synchronization"""
+        delayable = self.get_import_delayable(domain=domain, force=force)
+        if delayable:
+            delayable.delay()
+
+    def get_import_delayable(self, domain=None, force=False):
+        """Chain the chunk jobs of the levels, the jobs of a level start when
+        all the jobs of the previous level are done, and the job recomputing
+        the parent store.
+
+        :return: the chain, None when there is nothing to import
+        """
+        levels = self._get_levels_to_import(domain, force=force)
+        if not levels:
+            return None
+        stages = [
+            self._get_chunk_delayable(level, force=force, defer_parent_store=True)
+            for level in levels
+        ]
+        stages.append(
+            self.model.delayable(
+                channel=self.model._unique_channel_name,
+                priority=self.model._priority,
+            ).recompute_parent_store()
+        )
+        return chain(*stages)
+
+    def _get_levels_to_import(self, domain, force=False):
+        """Read the ids and parents of the records to import and group them
+        by level, see :meth:`_get_levels`"""
+        records = [
+            record
+            for page in self._iter_search_pages(
+                domain, ["id", self._parent_field, "write_date"]
+            )
+            for record in page
+        ]
+        levels = self._get_levels(records)
+        if self._filter_uptodate and not force:
+            to_import = {record["id"] for record in self._drop_uptodate(records)}
+            levels = [
+                [external_id for external_id in level if external_id in to_import]
+                for level in levels
+            ]
+            levels = [level for level in levels if level]
+        _logger.info(
+            "search for %s %s returned %s items in %s levels",
+            self.work.model_name,
+            domain,
+            sum(len(level) for level in levels),
+            len(levels),
+        )
+        return levels
+
+    def _get_levels(self, records):
+        """Group the ids by depth in the hierarchy of the records, a record
+        whose parent is not in the records is a root.
+
+        :return: list of lists of ids, the roots first
+        """
+        parents = {
+            record["id"]: record[self._parent_field] and record[self._parent_field][0]
+            for record in records
+        }
+        depths = {}
+        for record_id in parents:
+            path = []
+            current = record_id
+            while current in parents and current not in depths and current not in path:
+                path.append(current)
+                current = parents[current]
+            # A cycle is cut where it is found
+            depth = depths.get(current, -1)
+            for node in reversed(path):
+                depth += 1
+                depths[node] = depth
+        levels = [[] for __ in range(max(depths.values(), default=-1) + 1)]
+        for record_id in sorted(depths):
+            levels[depths[record_id]].append(record_id)
+        return levels
@@ -2,7 +2,9 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
 from odoo.addons.connector.exception import IDMissingInBackend, RetryableJobError
 from random import randint
+from requests.adapters import HTTPAdapter
 import requests
+import json
 import logging
 import time
 
@@ -15,6 +17,9 @@ class OdooAPI(object):
     Yet another Odoo API client with JSON-RPC.
     """
 
+    # Maximum size in bytes of the values sent by one call of the bulk methods
+    max_payload_size = 1 << 20
+
     def __init__(
         self,
         base_url,
@@ -25,6 +30,7 @@ class OdooAPI(object):
         uid=0,
         default_lang="tr_TR",
         translation_langs=None,
+        pool_size=10,
     ):
         self.base_url = base_url
         self.db = db
@@ -34,6 +40,12 @@ class OdooAPI(object):
         self._default_lang = default_lang
         self._translation_langs = translation_langs
         self._session = requests.Session()
+        # Keep-alive connections, shared by the jobs using this client
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self.last_used = time.time()
+        self._web_session = False
         self._uid = self._get_uid() if uid == 0 else uid
         if not self._uid:
             _logger.error("OdooAPI: Authentication failed. Username: %s", self.login)
@@ -45,7 +57,11 @@ class OdooAPI(object):
     def query_id(self):
         return randint(1, 99999)
 
+    def close(self):
+        self._session.close()
+
     def _post(self, payload):
+        self.last_used = time.time()
         try:
             response = self._session.post(
                 self.base_url + "/jsonrpc",
@@ -65,6 +81,54 @@ class OdooAPI(object):
                 seconds=5,
             )
 
+    def _authenticate_web_session(self):
+        """Open a web session, its cookie is kept by the requests session"""
+        payload = self._base_payload()
+        payload["params"].update(
+            {"db": self.db, "login": self.login, "password": self.password}
+        )
+        response = self._session.post(
+            self.base_url + "/web/session/authenticate",
+            json=payload,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        if response.json().get("error"):
+            raise requests.HTTPError(response.json()["error"])
+        self._web_session = True
+
+    def stream_binary(self, model, res_id, field, chunk_size=1 << 16):
+        """
+        Generator of the raw content of a binary field by chunks, read from
+        /web/content without base64 encoding nor holding it in memory.
+        """
+        self.last_used = time.time()
+        url = "{}/web/content/{}/{}/{}".format(self.base_url, model, res_id, field)
+        try:
+            authenticated = False
+            if not self._web_session:
+                self._authenticate_web_session()
+                authenticated = True
+            response = self._session.get(url, stream=True, timeout=self.timeout)
+            if not authenticated and (
+                "/web/login" in response.url
+                or response.status_code in (401, 403, 404)
+            ):
+                # The web session expired, the content is denied or hidden
+                # depending on the version, try once with a new session
+                response.close()
+                self._authenticate_web_session()
+                response = self._session.get(url, stream=True, timeout=self.timeout)
+            with response:
+                response.raise_for_status()
+                yield from response.iter_content(chunk_size=chunk_size)
+        except Exception as exc:
+            _logger.error(exc)
+            raise RetryableJobError(
+                "OdooAPI: Download error: {}".format(exc),
+                seconds=5,
+            )
+
     def _base_payload(self):
         return {
             "jsonrpc": "2.0",
@@ -151,6 +215,59 @@ class OdooAPI(object):
             )
         )
 
+    def create_multi(self, model, vals_list, context=None):
+        """
+        Create several records, one ``create`` call per chunk of values
+        under ``max_payload_size``.
+        Returns the ids in the order of the values.
+        """
+        ids = []
+        for __, chunk_ids in self.iter_create_multi(model, vals_list, context=context):
+            ids.extend(chunk_ids)
+        return ids
+
+    def iter_create_multi(self, model, vals_list, context=None):
+        """
+        Generator of the creation of several records, one ``create`` call per
+        chunk of values under ``max_payload_size``. Yields
+        ``(index of the first values of the chunk, ids of the chunk)`` as
+        soon as each chunk is created, so the caller can keep the ids even
+        when a later chunk fails.
+        """
+        index = 0
+        for chunk in self._chunk_by_payload(vals_list):
+            res = self._post(
+                self._build_execute_kw_payload(
+                    kwargs=[
+                        model,
+                        "create",
+                        [chunk],
+                        {
+                            "context": self._build_context(context=context),
+                        },
+                    ],
+                )
+            )
+            yield index, res if isinstance(res, list) else [res]
+            index += len(chunk)
+
+    def _chunk_by_payload(self, items, base_size=0):
+        """
+        Split the items in lists whose JSON size, plus ``base_size`` for the
+        data sent with every chunk, stays under ``max_payload_size``. An item
+        bigger than it is sent alone.
+        """
+        chunk, size = [], base_size
+        for item in items:
+            item_size = len(json.dumps(item, default=str))
+            if chunk and size + item_size > self.max_payload_size:
+                yield chunk
+                chunk, size = [], base_size
+            chunk.append(item)
+            size += item_size
+        if chunk:
+            yield chunk
+
     def search(
         self,
         model,
@@ -184,6 +301,38 @@ class OdooAPI(object):
             )
         )
 
+    def iter_search_read(
+        self,
+        model,
+        domain,
+        fields=None,
+        page_size=500,
+        context=None,
+        get_passive=None,
+    ):
+        """
+        Generator of the records matching the domain. The records are read
+        page by page on ``id > last id`` ordered by id, so each request stays
+        small whatever the number of records.
+        """
+        last_id = 0
+        if fields and "id" not in fields:
+            fields = list(fields) + ["id"]
+        while True:
+            records = self.search(
+                model,
+                list(domain) + [["id", ">", last_id]],
+                fields=fields,
+                limit=page_size,
+                order="id",
+                context=context,
+                get_passive=get_passive,
+            )
+            yield from records or []
+            if not records or len(records) < page_size:
+                break
+            last_id = records[-1]["id"]
+
     def write(self, res_id, model, data, context=None):
         """
         Single record writes.
@@ -201,6 +350,36 @@ class OdooAPI(object):
             )
         )
 
+    def write_multi(self, model, ids_vals, context=None):
+        """
+        Write several records. The records sharing the same values are
+        written together, by chunks of ids whose size with the values stays
+        under ``max_payload_size``.
+
+        :param ids_vals: dict ``{res_id or tuple of ids: vals}``
+        """
+        groups = {}
+        for res_ids, data in ids_vals.items():
+            if isinstance(res_ids, int):
+                res_ids = (res_ids,)
+            key = json.dumps(data, sort_keys=True, default=str)
+            groups.setdefault(key, (data, []))[1].extend(res_ids)
+        for key, (data, res_ids) in groups.items():
+            for chunk in self._chunk_by_payload(res_ids, base_size=len(key)):
+                self._post(
+                    self._build_execute_kw_payload(
+                        kwargs=[
+                            model,
+                            "write",
+                            [chunk, data],
+                            {
+                                "context": self._build_context(context=context),
+                            },
+                        ],
+                    )
+                )
+        return True
+
     def browse(self, model, res_id, fields=None, context=None, get_passive=None):
         if get_passive:
             base_domain = ["|", ["active", "=", True], ["active", "=", False]]
@@ -224,6 +403,37 @@ class OdooAPI(object):
         else:
             raise IDMissingInBackend("ID {} not found in backend".format(res_id))
 
+    def read_many(
+        self, model, ids, fields=None, chunk_size=200, context=None, get_passive=None
+    ):
+        """
+        Read several records with one ``search_read`` per chunk of ids.
+        Returns a dict keyed by id, missing ids are not in the result.
+        """
+        if get_passive:
+            base_domain = ["|", ["active", "=", True], ["active", "=", False]]
+        else:
+            base_domain = []
+        ids = list(dict.fromkeys(ids))
+        result = {}
+        for index in range(0, len(ids), chunk_size):
+            chunk = ids[index : index + chunk_size]
+            records = self._post(
+                self._build_execute_kw_payload(
+                    kwargs=[
+                        model,
+                        "search_read",
+                        [base_domain + [["id", "in", chunk]]],
+                        {
+                            "fields": fields,
+                            "context": self._build_context(context=context),
+                        },
+                    ],
+                )
+            )
+            result.update({record["id"]: record for record in records or []})
+        return result
+
     def unlink(self, res_id):
         raise NotImplementedError
 
@@ -4,6 +4,7 @@ from . import queue_job
 
 from . import odoo_binding  # Keep this order for inheritance
 from . import odoo_backend
+from . import odoo_export_outbox
 
 from . import base_multi_image_image
 from . import res_currency_rate
@@ -20,17 +20,7 @@ class AccountGroupBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.account.group"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo Account Group %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+    _prefetch_records = True
 
 
 class AccountGroupImportMapper(Component):
@@ -20,18 +20,6 @@ class AccountPaymentTermBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.account.payment.term"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo Account Group %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class AccountPaymentTermImportMapper(Component):
     _name = "odoo.account.payment.term.import.mapper"
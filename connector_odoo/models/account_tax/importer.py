@@ -20,18 +20,6 @@ class AccountTaxBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.account.tax"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo Account Group %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class AccountTaxImportMapper(Component):
     _name = "odoo.account.tax.import.mapper"
@@ -107,11 +95,10 @@ class AccountTaxImportMapper(Component):
         vals = {"children_tax_ids": []}
         binder = self.binder_for("odoo.account.tax")
         if record["amount_type"] == "group":
-            children = []
-            for tax_id in record["children_tax_ids"]:
-                local_tax = binder.to_internal(tax_id, unwrap=True)
-                if local_tax:
-                    children.append(local_tax.id)
+            local_taxes = binder.to_internal_many(
+                record["children_tax_ids"], unwrap=True
+            )
+            children = [tax.id for tax in local_taxes.values() if tax]
             vals.update({"children_tax_ids": [(6, 0, children)]})
         return vals
 
@@ -13,21 +13,9 @@ class AddressRegionBatchImporter(Component):
     """Import the Odoo Address District."""
 
     _name = "odoo.address.region.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.bulk.batch.importer"
     _apply_on = ["odoo.address.region"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo Address Region %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class AddressRegionImportMapper(Component):
     _name = "odoo.address.region.import.mapper"
@@ -12,25 +12,19 @@ class BaseMultiImageImageBatchImporter(Component):
     """
 
     _name = "odoo.base_multi_image.image.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.chunked.batch.importer"
     _apply_on = ["odoo.base_multi_image.image"]
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
         # We only want to import images that are related to products.
-        domain += [["owner_model", "in", ("product.template", "product.product")]]
-
-        external_ids = self.backend_adapter.search(
-            domain, model="base_multi_image.image"
-        )
-        _logger.info(
-            "search for odoo base multi images %s returned %s items",
-            domain,
-            len(external_ids),
+        domain = (domain or []) + [
+            ["owner_model", "in", ("product.template", "product.product")]
+        ]
+        return super(BaseMultiImageImageBatchImporter, self).run(
+            domain=domain, force=force
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class BaseMultiImageImageMapper(Component):
@@ -112,12 +106,9 @@ class BaseMultiImageImageMapper(Component):
         vals = {}
         if variant_ids := record["product_variant_ids"]:
             binder = self.binder_for("odoo.product.product")
-            variants = []
-            for variant_id in variant_ids:
-                variant = binder.to_internal(variant_id)
-                if variant:
-                    variants.append(variant.odoo_id.id)
-            vals["product_variant_ids"] = [(6, 0, variants)]
+            variants = binder.to_internal_many(variant_ids, unwrap=True)
+            variant_ids = [variant.id for variant in variants.values() if variant]
+            vals["product_variant_ids"] = [(6, 0, variant_ids)]
         else:
             vals["product_variant_ids"] = False
         return vals
@@ -63,18 +63,6 @@ class DeliveryCarrierAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
-        return super(DeliveryCarrierAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
-
 
 class DeliveryCarrierListener(Component):
     _name = "delivery.carrier.listener"
@@ -16,18 +16,6 @@ class DeliveryCarrierBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.delivery.carrier"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for delivery carriers %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class DeliveryCarrierMapper(Component):
     _name = "odoo.delivery.carrier.import.mapper"
@@ -13,21 +13,9 @@ class DeliveryPriceRuleBatchImporter(Component):
     """Import the Carrier Price Rules."""
 
     _name = "odoo.delivery.price.rule.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.bulk.batch.importer"
     _apply_on = ["odoo.delivery.price.rule"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for delivery carriers %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class DeliveryCarrierMapper(Component):
     _name = "odoo.delivery.price.rule.import.mapper"
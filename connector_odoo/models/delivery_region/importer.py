@@ -16,17 +16,7 @@ class DeliveryRegionBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.delivery.region"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for delivery regions %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+    _prefetch_records = True
 
     # def _import_dependencies(self, force=False):
     #     """Import the dependencies for the record"""
@@ -53,6 +53,13 @@ class IrAttachmentAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
+    # The content is downloaded apart, when the checksum changed.
+    _read_fields_from_mapper = True
+    # The store_fname is only read to match the local attachment with the
+    # same content, it is not mapped.
+    _read_fields = ["checksum", "res_id", "store_fname"]
+    _lazy_binary_fields = {"datas": "datas"}
+
 
 class IrAttachmentListener(Component):
     _name = "ir.attachment.listener"
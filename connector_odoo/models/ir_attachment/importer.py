@@ -1,4 +1,9 @@
+import hashlib
 import logging
+import os
+import tempfile
+
+from odoo import _
 
 from odoo.addons.component.core import Component
 from odoo.addons.connector.components.mapper import mapping, only_create
@@ -9,25 +14,17 @@ _logger = logging.getLogger(__name__)
 class IrAttachmentBatchImporter(Component):
     """Import the Odoo Attachment.
 
-    For every Attachment in the list, a delayed job is created.
+    The records are imported by chunks of delayed jobs.
     Import from a date
     """
 
     _name = "odoo.ir.attachment.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.chunked.batch.importer"
     _apply_on = ["odoo.ir.attachment"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo Attachment %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+    def _prefetch_binary_checksums(self, external_ids):
+        """The checksum of the attachment is read with the record"""
+        return
 
 
 class IrAttachmentImportMapper(Component):
@@ -36,15 +33,11 @@ class IrAttachmentImportMapper(Component):
     _apply_on = ["odoo.ir.attachment"]
 
     direct = [
-        ("datas", "datas"),
-        ("db_datas", "db_datas"),
         ("name", "name"),
         ("description", "description"),
         ("type", "type"),
         ("res_model", "res_model"),
         ("res_name", "res_name"),
-        ("store_fname", "store_fname"),
-        ("file_size", "file_size"),
         ("index_content", "index_content"),
         ("usage", "usage"),
     ]
@@ -89,6 +82,103 @@ class IrAttachmentImporter(Component):
             )
         return binding
 
+    def _get_binary_fingerprints(self):
+        """The checksum of the attachment is read with the record"""
+        return {"datas": self.odoo_record.get("checksum") or False}
+
+    def _get_stored_binary_fingerprints(self, binding):
+        """Compare with the checksum of the local attachment"""
+        return {"datas": binding.checksum or False}
+
+    def import_binary_fields(self, external_id, fingerprints):
+        """INHERITED to stream the content straight to the filestore"""
+        attachment_model = self.env["ir.attachment"].sudo()
+        if (
+            self.backend_record.attachment_transfer_mode != "stream"
+            or attachment_model._storage() != "file"
+            or "datas" not in fingerprints
+        ):
+            return super(IrAttachmentImporter, self).import_binary_fields(
+                external_id, fingerprints
+            )
+        self.external_id = external_id
+        binding = self._get_binding()
+        if not binding:
+            return _("The record is not imported yet.")
+        fname, checksum, file_size, head = self._stream_to_filestore(external_id)
+        attachment = binding.odoo_id.sudo()
+        old_fname = attachment.store_fname
+        mimetype = attachment_model._compute_mimetype(
+            {"name": attachment.name, "raw": head}
+        )
+        # ir.attachment's create and write compute these fields from the
+        # content, they can only be set directly.
+        self.env.flush_all()
+        self.env.cr.execute(
+            """
+            UPDATE ir_attachment
+            SET store_fname = %s, checksum = %s, file_size = %s, mimetype = %s,
+                db_datas = NULL
+            WHERE id = %s
+            """,
+            (fname, checksum, file_size, mimetype, attachment.id),
+        )
+        attachment.invalidate_recordset(
+            [
+                "store_fname",
+                "checksum",
+                "file_size",
+                "mimetype",
+                "db_datas",
+                "datas",
+                "raw",
+            ]
+        )
+        if old_fname and old_fname != fname:
+            attachment_model._file_delete(old_fname)
+        return _("Attachment content streamed: %s bytes") % file_size
+
+    def _stream_to_filestore(self, external_id):
+        """Download the content by chunks in a temporary file of the filestore,
+        hashing it on the fly, then move the file to its checksum path.
+
+        :return: tuple ``(store_fname, checksum, file_size, head)``, ``head``
+                 being the first chunk of the content to guess its mimetype
+        """
+        attachment_model = self.env["ir.attachment"].sudo()
+        filestore = attachment_model._filestore()
+        os.makedirs(filestore, exist_ok=True)
+        sha1 = hashlib.sha1()
+        file_size = 0
+        head = b""
+        fd, tmp_path = tempfile.mkstemp(dir=filestore, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                for chunk in self.work.odoo_api.stream_binary(
+                    "ir.attachment", external_id, "datas"
+                ):
+                    if not head:
+                        head = chunk
+                    sha1.update(chunk)
+                    file_size += len(chunk)
+                    tmp_file.write(chunk)
+            checksum = sha1.hexdigest()
+            fname = checksum[:2] + "/" + checksum
+            full_path = attachment_model._full_path(fname)
+            if os.path.isfile(full_path):
+                os.unlink(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.replace(tmp_path, full_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        # Like ir.attachment._file_write, the garbage collector drops the file
+        # if the transaction is rolled back.
+        attachment_model._mark_for_gc(fname)
+        return fname, checksum, file_size, head
+
     # # FIXUP: We shouldn't skip the import. The record could be updated.
     # def _must_skip(
     #     self,
@@ -58,21 +58,13 @@ class MrpBomAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
+    def _get_search_domain(self, domain=None):
+        """Add the external domain filter of the backend"""
+        domain = super(MrpBomAdapter, self)._get_search_domain(domain)
         ext_filter = ast.literal_eval(
             str(self.backend_record.external_bom_domain_filter)
         )
-        domain += ext_filter or []
-        return super(MrpBomAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
+        return domain + (ext_filter or [])
 
 
 class MrpBomListener(Component):
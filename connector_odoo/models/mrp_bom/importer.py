@@ -30,14 +30,7 @@ class MrpBomBatchImporter(Component):
             .mapped("external_id")
         )
         domain.append(("product_tmpl_id", "in", imported_products))
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for delivery regions %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+        return super(MrpBomBatchImporter, self).run(domain=domain, force=force)
 
 
 class MrpBomMapper(Component):
@@ -15,18 +15,6 @@ class MrpBomLineBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.mrp.bom.line"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for MRP BoM Lines %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class MrpBomLineMapper(Component):
     _name = "odoo.mrp.bom.line.import.mapper"
@@ -18,17 +18,6 @@ class MrpBomTemplateLineBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.mrp.bom.template.line"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for MRP BoM Template line %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class MrpBomTemplateLineMapper(Component):
     _name = "odoo.mrp.bom.template.line.import.mapper"
@@ -89,10 +78,10 @@ class MrpBomTemplateLineMapper(Component):
         # local_bom_id = bom_binder.to_internal(record["bom_id"][0], unwrap=True)
         if attribute_value_ids := record["attribute_value_ids"]:
             val_ids = []
-            for attr_val in attribute_value_ids:
-                local_attr_val = attribute_value_binder.to_internal(
-                    attr_val, unwrap=True
-                )
+            local_attr_vals = attribute_value_binder.to_internal_many(
+                attribute_value_ids, unwrap=True
+            )
+            for attr_val, local_attr_val in local_attr_vals.items():
                 if not local_attr_val:
                     raise MappingError(
                         f"Product Attribute Value with external id"
@@ -102,10 +91,10 @@ class MrpBomTemplateLineMapper(Component):
             res["attribute_value_ids"] = [(6, 0, val_ids)]
         if target_attribute_value_ids := record["target_attribute_value_ids"]:
             val_ids = []
-            for attr_val in target_attribute_value_ids:
-                local_attr_val = attribute_value_binder.to_internal(
-                    attr_val, unwrap=True
-                )
+            local_attr_vals = attribute_value_binder.to_internal_many(
+                target_attribute_value_ids, unwrap=True
+            )
+            for attr_val, local_attr_val in local_attr_vals.items():
                 if not local_attr_val:
                     raise MappingError(
                         f"Product Attribute Value with external id"
@@ -115,8 +104,10 @@ class MrpBomTemplateLineMapper(Component):
             res["target_attribute_value_ids"] = [(6, 0, val_ids)]
         if inherited_attribute_ids := record["inherited_attribute_ids"]:
             attr_ids = []
-            for attr in inherited_attribute_ids:
-                local_attr = attribute_binder.to_internal(attr, unwrap=True)
+            local_attrs = attribute_binder.to_internal_many(
+                inherited_attribute_ids, unwrap=True
+            )
+            for attr, local_attr in local_attrs.items():
                 if not local_attr:
                     raise MappingError(
                         f"Product Attribute with external id {attr} not found."
@@ -2,20 +2,127 @@
 # © 2016 Sodexis
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import hashlib
 import logging
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError
 
+from odoo.addons.queue_job.delay import chain, group
+
 # pylint: disable=W7950
 from odoo.addons.connector_odoo.components.odoo_api import OdooAPI
 
 IMPORT_DELTA_BUFFER = 30  # seconds
 
+# Binding models which must be imported before a binding model, so its
+# records can be mapped without importing them as dependencies.
+IMPORT_DEPENDENCIES = {
+    "odoo.account.account": ["odoo.account.group", "odoo.res.currency"],
+    "odoo.account.fiscal.position": ["odoo.account.account", "odoo.account.tax"],
+    "odoo.account.tax": ["odoo.account.tax.group"],
+    "odoo.address.neighbour": ["odoo.address.region"],
+    "odoo.address.region": ["odoo.address.district"],
+    "odoo.delivery.carrier": ["odoo.product.product"],
+    "odoo.delivery.price.rule": ["odoo.delivery.carrier", "odoo.delivery.region"],
+    "odoo.mrp.bom": ["odoo.product.product", "odoo.product.template", "odoo.uom.uom"],
+    "odoo.product.attribute": ["odoo.product.attribute.group"],
+    "odoo.product.attribute.value": ["odoo.product.attribute"],
+    "odoo.product.brand": ["odoo.res.partner"],
+    "odoo.product.category": [
+        "odoo.feature.icon",
+        "odoo.product.category.table.attribute.lines",
+    ],
+    "odoo.product.product": [
+        "odoo.product.attribute.value",
+        "odoo.product.template",
+        "odoo.res.partner",
+        "odoo.uom.uom",
+    ],
+    "odoo.product.template": [
+        "odoo.feature.icon",
+        "odoo.product.brand",
+        "odoo.product.category",
+        "odoo.uom.uom",
+    ],
+    "odoo.res.partner": [
+        "odoo.account.account",
+        "odoo.account.fiscal.position",
+        "odoo.account.payment.term",
+        "odoo.address.neighbour",
+        "odoo.product.pricelist",
+        "odoo.utm.campaign",
+        "odoo.utm.medium",
+        "odoo.utm.source",
+    ],
+}
+
+
+def get_import_tiers(model_names):
+    """Split the binding models in tiers, the models of a tier only depend
+    on the models of the previous tiers (directly or through models which
+    are not in ``model_names``).
+
+    :return: list of lists of model names
+    """
+
+    def _all_dependencies(model_name, seen):
+        for dependency in IMPORT_DEPENDENCIES.get(model_name, []):
+            if dependency not in seen:
+                seen.add(dependency)
+                _all_dependencies(dependency, seen)
+        return seen
+
+    dependencies = {
+        model_name: _all_dependencies(model_name, set()) & set(model_names)
+        for model_name in model_names
+    }
+    remaining = list(model_names)
+    tiers = []
+    while remaining:
+        tier = [
+            model_name
+            for model_name in remaining
+            if not dependencies[model_name] & set(remaining)
+        ]
+        # A cycle in the dependencies, import the remaining models together
+        tier = tier or remaining
+        tiers.append(tier)
+        remaining = [model_name for model_name in remaining if model_name not in tier]
+    return tiers
+
+
+# OdooAPI instances of each thread of the worker, keyed by database, backend
+# and credentials, so the jobs reuse the keep-alive sessions. The threads
+# don't share them, a requests.Session is not thread-safe.
+_CONNECTION_CACHE = threading.local()
+CONNECTION_FIELDS = (
+    "protocol",
+    "hostname",
+    "port",
+    "database",
+    "login",
+    "password",
+    "timeout",
+    "uid",
+    "default_lang_id",
+    "translation_lang_ids",
+    "connection_pool_size",
+)
+
 _logger = logging.getLogger(__name__)
 
 
+def _get_connection_cache():
+    """Return the connections of the current thread ``{cache key: OdooAPI}``"""
+    if not hasattr(_CONNECTION_CACHE, "connections"):
+        _CONNECTION_CACHE.connections = {}
+    return _CONNECTION_CACHE.connections
+
+
 class OdooBackend(models.Model):
     """Model for Odoo Backends"""
 
@@ -68,6 +175,27 @@ class OdooBackend(models.Model):
         help="Timeout in seconds for the connection to the backend",
     )
 
+    connection_pool_size = fields.Integer(
+        default=10,
+        help="Number of keep-alive HTTP connections kept to the backend by "
+        "each worker process",
+    )
+    connection_idle_timeout = fields.Integer(
+        default=300,
+        help="Seconds after which an unused cached connection is dropped",
+    )
+    attachment_transfer_mode = fields.Selection(
+        selection=[
+            ("rpc", "JSON-RPC"),
+            ("stream", "Stream to the filestore"),
+        ],
+        default="stream",
+        required=True,
+        help="JSON-RPC reads the attachment contents as base64 strings. "
+        "Stream downloads them from /web/content by chunks straight to the "
+        "filestore, when the attachments are stored in files.",
+    )
+
     uid = fields.Integer(
         string="User ID in the external system",
         help="""The user id that represents this system in the external
@@ -194,7 +322,7 @@ class OdooBackend(models.Model):
     def get_translation_lang_codes(self):
         return self.translation_lang_ids.mapped("code")
 
-    def get_connection(self):
+    def _build_connection(self):
         self.ensure_one()
         return OdooAPI(
             base_url=self.protocol + "://" + self.hostname + ":" + str(self.port),
@@ -205,7 +333,69 @@ class OdooBackend(models.Model):
             uid=self.uid,
             default_lang=self.get_default_language_code(),
             translation_langs=self.get_translation_lang_codes(),
+            pool_size=self.connection_pool_size or 10,
+        )
+
+    def _get_connection_cache_key(self):
+        self.ensure_one()
+        credentials = "|".join(
+            str(value)
+            for value in (
+                self.protocol,
+                self.hostname,
+                self.port,
+                self.database,
+                self.login,
+                self.password,
+                self.uid,
+                self.timeout,
+                self.get_default_language_code(),
+                self.get_translation_lang_codes(),
+                self.connection_pool_size,
+            )
         )
+        return (
+            self.env.cr.dbname,
+            self.id,
+            hashlib.sha256(credentials.encode("utf-8")).hexdigest(),
+        )
+
+    def get_connection(self):
+        """Return the cached OdooAPI of the backend, a new one is created
+        when there is none or when it was idle for too long. The connection
+        settings are part of the cache key, a change of them by this process
+        or another one gives a new connection."""
+        self.ensure_one()
+        key = self._get_connection_cache_key()
+        connections = _get_connection_cache()
+        odoo_api = connections.get(key)
+        if odoo_api and time.time() - odoo_api.last_used > self.connection_idle_timeout:
+            del connections[key]
+            odoo_api.close()
+            odoo_api = None
+        if odoo_api:
+            return odoo_api
+
+        odoo_api = self._build_connection()
+        if not odoo_api._uid:
+            # Do not keep a connection that failed to authenticate
+            return odoo_api
+        connections[key] = odoo_api
+        return odoo_api
+
+    def _invalidate_connection_cache(self):
+        """Close the connections of the backends in the current thread, the
+        other threads and processes don't find theirs anymore on the next
+        :meth:`get_connection` as the key of the settings changed"""
+        connections = _get_connection_cache()
+        for key in list(connections):
+            if key[0] == self.env.cr.dbname and key[1] in self.ids:
+                connections.pop(key).close()
+
+    def write(self, vals):
+        if any(field in vals for field in CONNECTION_FIELDS):
+            self._invalidate_connection_cache()
+        return super(OdooBackend, self).write(vals)
 
     def button_check_connection(self):
         odoo_api = self.get_connection()
@@ -226,6 +416,19 @@ class OdooBackend(models.Model):
         self.ensure_one()
         lang = self.get_default_language_code()
         _conn = self.get_connection()
+        # Shared by the nested importers of the work to import each
+        # dependency once, see ``OdooImporter._import_dependency``
+        kwargs.setdefault("dependency_registry", {"visited": set(), "skipped": 0})
+        # List filled with the ids found by the batch importers instead of
+        # importing them, see ``BatchImporter.get_import_delayable``
+        kwargs.setdefault("collected_ids", None)
+        # Set when the parent store is recomputed once after a hierarchy import
+        kwargs.setdefault("defer_parent_store", False)
+        # Set active by the batch importers committing several records at once
+        kwargs.setdefault("commit_batch", {"active": False, "count": 0, "started": 0})
+        # Remote checksums of the lazy binary fields ``{model: {id: {field:
+        # checksum}}}``, read by chunk by the batch importers
+        kwargs.setdefault("binary_checksums", {})
         _super = super(OdooBackend, self.with_context(lang=lang))
         # from the components we'll be able to do: self.work.odoo_api
         with _super.work_on(model_name, odoo_api=_conn, **kwargs) as work:
@@ -277,13 +480,59 @@ class OdooBackend(models.Model):
         """
         backends = self._get_backends()
         for backend in backends:
-            for model in models:
-                next_time = self._cron_import(
-                    model, date_field, backend, is_single=False
-                )
+            next_time = backend._import_tiers_from_date(
+                models, getattr(backend, date_field)
+            )
             backend.write({date_field: next_time})
         return True
 
+    def _import_tiers_from_date(self, model_names, from_date):
+        """Import the models tier by tier (see ``IMPORT_DEPENDENCIES``). The
+        records are searched by :meth:`import_tiers` in a job, so an error of
+        Odoo is retried by the job instead of failing the cron."""
+        self.ensure_one()
+        import_start_time = datetime.now()
+        domain = self._get_import_from_date_domain(import_start_time, from_date)
+        tiers = get_import_tiers(model_names)
+        if tiers:
+            self.with_delay().import_tiers(tiers, domain)
+        return self._get_next_import_time(import_start_time)
+
+    def import_tiers(self, tiers, domain):
+        """Search the records to import of the models of the first tier and
+        chain their chunk jobs with the job importing the next tiers, which
+        starts when they are all done.
+
+        A model whose search fails is imported by a batch import job of its
+        own, retried apart, the other models of the tier go on.
+        """
+        self.ensure_one()
+        delayables = []
+        for model_name in tiers[0]:
+            try:
+                with self.env.cr.savepoint(), self.work_on(model_name) as work:
+                    importer = work.component(usage="batch.importer")
+                    delayable = importer.get_import_delayable(
+                        domain=list(domain), force=self.force
+                    )
+            except Exception as e:
+                _logger.warning(
+                    "Search of the %s records to import failed, "
+                    "imported by their own job: %s",
+                    model_name,
+                    e,
+                )
+                self.env[model_name].delayed_import_batch(self, domain)
+                continue
+            if delayable:
+                delayables.append(delayable)
+        stages = [group(*delayables)] if delayables else []
+        if tiers[1:]:
+            stages.append(self.delayable().import_tiers(tiers[1:], domain))
+        if stages:
+            chain(*stages).delay()
+        return _("Searched %s, %s tiers left") % (", ".join(tiers[0]), len(tiers) - 1)
+
     def _cron_import(self, model_name, from_date_field, backend, is_single=True):
         """
         Base method to import data from Odoo with cron.
@@ -376,19 +625,22 @@ class OdooBackend(models.Model):
         next_time = import_start_time - timedelta(seconds=IMPORT_DELTA_BUFFER)
         return fields.Datetime.to_string(next_time)
 
+    def _get_import_from_date_domain(self, import_start_time, from_date):
+        domain = [("write_date", "<", fields.Datetime.to_string(import_start_time))]
+        if from_date:
+            domain.append(
+                (
+                    "write_date",
+                    ">",
+                    fields.Datetime.to_string(from_date),
+                )
+            )
+        return domain
+
     def _import_from_date(self, model, from_date_field):
         import_start_time = datetime.now()
-        domain = [("write_date", "<", fields.Datetime.to_string(import_start_time))]
+        domain = self._get_import_from_date_domain(import_start_time, from_date_field)
         for backend in self:
-            if from_date_field:
-                from_date = fields.Datetime.to_string(from_date_field)
-                domain.append(
-                    (
-                        "write_date",
-                        ">",
-                        from_date,
-                    )
-                )
             self.env[model].delayed_import_batch(backend, domain)
         return self._get_next_import_time(import_start_time)
 
@@ -24,3 +24,5 @@ class MetadataBatchImporter(Component):
         "odoo.product.uom",
         "odoo.product.attribute",
     ]
+
+    _prefetch_records = True
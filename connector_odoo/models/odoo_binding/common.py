@@ -1,11 +1,21 @@
 # © 2013-2017 Guewen Baconnier,Camptocamp SA,Akretion
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
-from odoo import _, api, fields, models
+from odoo import _, api, fields, models, tools
 from odoo.exceptions import ValidationError
 from odoo.addons.connector.exception import RetryableJobError
+from odoo.addons.connector_odoo.components.binder import (
+    get_binder_cache,
+    invalidate_binder_cache,
+)
+from odoo.addons.connector_odoo.components.importer import identity_import_record
+from odoo.addons.queue_job.job import Job, identity_exact
+from datetime import timedelta
 from hashlib import md5
+import logging
 import time
 
+_logger = logging.getLogger(__name__)
+
 
 class OdooBinding(models.AbstractModel):
     """Abstract Model for the Bindings.
@@ -27,6 +37,16 @@ class OdooBinding(models.AbstractModel):
         ondelete="restrict",
     )
     external_id = fields.Integer(string="ID on Ext Odoo", required=False)
+    sync_hash = fields.Char(
+        copy=False,
+        help="Hash of the values and translations of the last import, the "
+        "record is not written again while they don't change",
+    )
+    binary_fingerprints = fields.Json(
+        string="Binary Fingerprints",
+        copy=False,
+        help="Fingerprints on Odoo of the binary fields of the last download",
+    )
     _sql_constraints = [
         (
             "odoo_backend_odoo_uniq",
@@ -35,6 +55,99 @@ class OdooBinding(models.AbstractModel):
         )
     ]
 
+    def _auto_init(self):
+        """INHERITED to index the bindings on (backend_id, external_id), the
+        columns of every binder lookup."""
+        res = super(OdooBinding, self)._auto_init()
+        if self._auto and not self._abstract:
+            tools.create_index(
+                self.env.cr,
+                tools.make_index_name(self._table, "backend_id_external_id"),
+                self._table,
+                ["backend_id", "external_id"],
+            )
+        return res
+
+    @api.model
+    def _get_binding_ids_by_external_id(self, backend_id, external_ids):
+        """Give the binding ids of the external ids with a direct query on
+        the (backend_id, external_id) index. Out of superuser mode, the
+        bindings are filtered by the record rules like with a search.
+
+        :return: a dict ``{external_id: [binding ids]}``, the unknown
+                 external ids are not in it
+        """
+        self.flush_model(["backend_id", "external_id"])
+        self.env.cr.execute(
+            'SELECT external_id, id FROM "%s" '
+            "WHERE backend_id = %%s AND external_id = ANY(%%s)" % self._table,
+            (backend_id, [int(external_id) for external_id in external_ids]),
+        )
+        rows = self.env.cr.fetchall()
+        if rows and not self.env.su:
+            allowed_ids = set(
+                self.with_context(active_test=False)
+                .search([("id", "in", [binding_id for __, binding_id in rows])])
+                .ids
+            )
+            rows = [row for row in rows if row[1] in allowed_ids]
+        res = {}
+        for external_id, binding_id in rows:
+            res.setdefault(external_id, []).append(binding_id)
+        return res
+
+    @api.model
+    def _get_uptodate_external_ids(self, backend_id, external_dates):
+        """Give the external ids whose binding was synchronized after the
+        given write date on Odoo.
+
+        :param external_dates: list of ``(external_id, write_date)``
+        :return: a set of external ids
+        """
+        if not external_dates:
+            return set()
+        self.flush_model(["backend_id", "external_id", "sync_date"])
+        external_ids, write_dates = zip(*external_dates)
+        self.env.cr.execute(
+            "SELECT r.external_id "
+            "FROM unnest(%%s::int[], %%s::timestamp[]) AS r(external_id, write_date) "
+            'JOIN "%s" b ON b.external_id = r.external_id AND b.backend_id = %%s '
+            "WHERE r.write_date < b.sync_date" % self._table,
+            (
+                list(external_ids),
+                [write_date or None for write_date in write_dates],
+                backend_id,
+            ),
+        )
+        return {row[0] for row in self.env.cr.fetchall()}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        bindings = super(OdooBinding, self).create(vals_list)
+        external_ids = bindings.filtered("external_id").mapped("external_id")
+        invalidate_binder_cache(self.env.cr, self._name, external_ids)
+        return bindings
+
+    def write(self, vals):
+        if "external_id" in vals or "backend_id" in vals:
+            external_ids = self.filtered("external_id").mapped("external_id")
+            invalidate_binder_cache(
+                self.env.cr, self._name, external_ids + [vals.get("external_id")]
+            )
+        return super(OdooBinding, self).write(vals)
+
+    def unlink(self):
+        external_ids = self.filtered("external_id").mapped("external_id")
+        invalidate_binder_cache(self.env.cr, self._name, external_ids)
+        return super(OdooBinding, self).unlink()
+
+    def with_delay(self, *args, **kwargs):
+        """INHERITED to give an identity to the connector jobs: the hash of
+        the model, the method, the records and the arguments (backend,
+        external id, force...). A job identical to a job not started yet is
+        not enqueued, the existing job is returned instead."""
+        kwargs.setdefault("identity_key", identity_exact)
+        return super(OdooBinding, self).with_delay(*args, **kwargs)
 
     @property
     def _unique_channel_name(self):
@@ -57,6 +170,14 @@ class OdooBinding(models.AbstractModel):
         md5_hash = md5(self._name.encode("utf-8")).hexdigest()
         return f"root.{sum(ord(x) for x in md5_hash) % 10}"
 
+    @property
+    def _binary_channel_name(self):
+        """
+        Binary fields are downloaded on their own channel, so their concurrency
+        can be limited with the capacity of ``root.binary``.
+        """
+        return "root.binary"
+
     @property
     def _priority(self):
         """
@@ -68,25 +189,56 @@ class OdooBinding(models.AbstractModel):
         else:
             return 99
 
+    @property
+    def _import_chunk_size(self):
+        """
+        Number of records imported by each job of the chunked batch importers.
+        """
+        if hasattr(self, "_queue_chunk_size") and self._queue_chunk_size:
+            return self._queue_chunk_size
+        else:
+            return 50
+
+    @property
+    def _export_debounce_delay(self):
+        """
+        Seconds without change of a binding before its export starts, the
+        exports of the binding requested meanwhile are merged in the same job.
+        """
+        if hasattr(self, "_export_debounce") and self._export_debounce is not None:
+            return self._export_debounce
+        else:
+            return 10
+
+    @property
+    def _use_export_outbox(self):
+        """
+        The exports of the model go through ``odoo.export.outbox`` and are
+        flushed by batches instead of having a job each.
+        """
+        return hasattr(self, "_export_outbox") and self._export_outbox
+
     def resync(self):
         return self.delayed_import_record(self.backend_id, self.external_id, force=True)
 
     @api.constrains("backend_id", "external_id")
     def unique_backend_external_id(self):
-        if self.external_id > 0:
-            count = self.env[self._name].search_count(
-                [
-                    ("backend_id", "=", self.backend_id.id),
-                    ("external_id", "=", self.external_id),
-                    ("id", "!=", self.id),
-                ]
-            )
-            if count > 0:
+        for binding in self:
+            if binding.external_id <= 0:
+                continue
+            binding_ids = self._get_binding_ids_by_external_id(
+                binding.backend_id.id, [binding.external_id]
+            ).get(binding.external_id, [])
+            if set(binding_ids) - {binding.id}:
                 raise ValidationError(
                     _(
                         "A binding already exists with the same backend '{name}' "
-                        "for the external id {external_id} of the model {_name}"
-                    ).format(self.backend_id.name, self.external_id, self._name)
+                        "for the external id {external_id} of the model {model}"
+                    ).format(
+                        name=binding.backend_id.name,
+                        external_id=binding.external_id,
+                        model=self._name,
+                    )
                 )
 
     """
@@ -121,14 +273,30 @@ class OdooBinding(models.AbstractModel):
         )
 
     @api.model
-    def import_record(self, backend, external_id, force=False):
-        """Import a Odoo record"""
+    def import_record(self, backend, external_id, force=False, odoo_record=None):
+        """Import a Odoo record
+
+        :param odoo_record: data of the record when it is already fetched,
+                            it is read again when the job is retried
+        """
+        job_ = self._get_current_job()
+        if odoo_record is not None and job_ and job_.retry:
+            odoo_record = None
         with backend.work_on(self._name) as work:
             importer = work.component(usage="record.importer")
             importer.set_lock(external_id)
             importer._connect_with_job(self._context)
             try:
-                return importer.run(external_id, force=force)
+                res = importer.run(external_id, force=force, odoo_record=odoo_record)
+                _logger.info(
+                    "Binder lookup cache of the job: %(hits)s hits, %(misses)s misses",
+                    get_binder_cache(self.env.cr),
+                )
+                _logger.info(
+                    "Repeated dependency imports skipped by the job: %s",
+                    work.dependency_registry["skipped"],
+                )
+                return res
             except Exception as e:
                 # Bağlantı hatalarında iş sürekli tekrar deneniyor ve delay olmadığı
                 # zaman retry_count çok hızlı bir şekilde doluyor. Delay ekleyerek
@@ -139,6 +307,103 @@ class OdooBinding(models.AbstractModel):
                     seconds=5,
                 )
 
+    @api.model
+    def import_record_chunk(
+        self,
+        backend,
+        external_ids,
+        force=False,
+        defer_parent_store=False,
+        in_chain=False,
+    ):
+        """Import a chunk of Odoo records, the failed ones are delayed again
+        one by one
+
+        :param defer_parent_store: the parent store is recomputed by another
+                                   job, the importers don't update it
+        :param in_chain: the next jobs of the chain need the records, the job
+                         is retried for the failed ones while it has retries
+                         left instead of delaying them
+        """
+        with backend.work_on(
+            self._name, defer_parent_store=defer_parent_store
+        ) as work:
+            importer = work.component(usage="batch.importer")
+            failed_ids = importer.import_chunk(external_ids, force=force)
+            _logger.info(
+                "Repeated dependency imports skipped by the job: %s",
+                work.dependency_registry["skipped"],
+            )
+        if failed_ids and in_chain and self._job_can_retry():
+            # The imported records are up-to-date and skipped on the retry
+            raise RetryableJobError(
+                "Could not import records %s of the chunk" % failed_ids,
+                seconds=5,
+            )
+        for external_id in failed_ids:
+            self.delayed_import_record(backend, external_id, force=force)
+        return _("Imported %s records, delayed again: %s") % (
+            len(external_ids) - len(failed_ids),
+            failed_ids,
+        )
+
+    @api.model
+    def _get_current_job(self):
+        """Return the running job, None out of a job. Its ``retry`` is the
+        number of the previous attempts, the running one is not stored yet"""
+        job_uuid = self.env.context.get("job_uuid")
+        return Job.load(self.env, job_uuid) if job_uuid else None
+
+    @api.model
+    def _job_can_retry(self):
+        """Whether the running job is retried if it raises a
+        ``RetryableJobError``, False out of a job"""
+        job_ = self._get_current_job()
+        if not job_:
+            return False
+        return not job_.max_retries or job_.retry + 1 < job_.max_retries
+
+    @api.model
+    def import_binary_fields(self, backend, external_id, fingerprints):
+        """Download the binary fields of a Odoo record"""
+        with backend.work_on(self._name) as work:
+            importer = work.component(usage="record.importer")
+            importer.set_lock(external_id)
+            return importer.import_binary_fields(external_id, fingerprints)
+
+    @api.model
+    def recompute_parent_store(self):
+        """Recompute the parent store of the imported model, once at the end
+        of a hierarchy import"""
+        model = self.env[self._fields["odoo_id"].comodel_name]
+        if not model._parent_store:
+            return _("%s has no parent store") % model._name
+        model._parent_store_compute()
+        return _("Parent store of %s recomputed") % model._name
+
+    @api.model
+    def delayed_recompute_parent_store(self):
+        """Mark the parent store of the imported model as dirty.
+
+        The marker is the pending recompute job: the imports done before it
+        starts share it, so the parent store is recomputed at most once per
+        interval (``connector_odoo.parent_store_interval``, in seconds).
+        """
+        interval = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("connector_odoo.parent_store_interval", 300)
+        )
+        return (
+            self.sudo()
+            .with_delay(
+                channel=self._unique_channel_name,
+                priority=self._priority,
+                eta=interval,
+            )
+            .recompute_parent_store()
+        )
+
     @api.model
     def delayed_import_record(self, backend, external_id, force=False):
         return (
@@ -146,6 +411,7 @@ class OdooBinding(models.AbstractModel):
             .with_delay(
                 channel=self._unique_channel_name,
                 priority=self._priority,
+                identity_key=identity_import_record,
             )
             .import_record(backend, external_id, force=force)
         )
@@ -169,18 +435,92 @@ class OdooBinding(models.AbstractModel):
         with backend.work_on(self._name) as work:
             exporter = work.component(usage="record.exporter")
             exporter._connect_with_job(self._context)
-            return exporter.run(self)
+            return exporter.run(self, fields=fields)
 
     def delayed_export_record(self, backend, local_id=None, fields=None):
+        """Delay the export of the binding after the debounce delay. When an
+        export of the binding is already waiting, the fields are merged in
+        it and it is postponed instead."""
+        self.ensure_one()
+        if self._use_export_outbox:
+            return self.env["odoo.export.outbox"].add(self, backend, fields)
+        identity_key = self._get_export_identity_key(backend)
+        pending_job, identity_key = self._merge_pending_export(identity_key, fields)
+        if pending_job:
+            return Job.load(self.env, pending_job.uuid)
         return (
             self.sudo()
             .with_delay(
                 channel=self._unique_channel_name,
                 priority=self._priority,
+                eta=self._export_debounce_delay,
+                identity_key=identity_key,
             )
             .export_record(backend, local_id=local_id, fields=fields)
         )
 
+    def _get_export_identity_key(self, backend):
+        """Identity shared by the exports of the binding, whatever the fields"""
+        self.ensure_one()
+        key = "%s(%s).export_record(%s)" % (self._name, self.id, backend.id)
+        return md5(key.encode("utf-8")).hexdigest()
+
+    @api.model
+    def _merge_export_fields(self, pending_fields, export_fields):
+        """Fields exported by a job merged with another export, None when
+        one of them exports all the fields"""
+        if pending_fields is None or export_fields is None:
+            return None
+        return sorted(set(pending_fields) | set(export_fields))
+
+    def _merge_pending_export(self, identity_key, export_fields):
+        """Merge the fields in the export job of the binding not started yet
+        and postpone it after the debounce delay.
+
+        A job already enqueued, started or locked by the jobrunner can't
+        take the fields anymore. The export then goes in the job following
+        it, whose identity key is derived from the uuid of the job.
+
+        :param export_fields: fields to export, None for all the fields
+        :return: tuple ``(pending queue.job or None, identity key of the
+                 job to delay when there is none)``
+        """
+        while True:
+            self.env.cr.execute(
+                "SELECT id, uuid, state FROM queue_job WHERE identity_key = %s "
+                "AND state IN ('pending', 'enqueued', 'started') "
+                "ORDER BY id DESC LIMIT 1",
+                (identity_key,),
+            )
+            row = self.env.cr.fetchone()
+            if not row:
+                return None, identity_key
+            job_id, job_uuid, state = row
+            if state == "pending":
+                self.env.cr.execute(
+                    "SELECT id FROM queue_job WHERE id = %s AND state = 'pending' "
+                    "FOR UPDATE SKIP LOCKED",
+                    (job_id,),
+                )
+                if self.env.cr.fetchone():
+                    break
+            identity_key = md5(
+                ("%s:%s" % (identity_key, job_uuid)).encode("utf-8")
+            ).hexdigest()
+        pending_job = self.env["queue.job"].sudo().browse(job_id)
+        kwargs = dict(pending_job.kwargs)
+        kwargs["fields"] = self._merge_export_fields(
+            kwargs.get("fields"), export_fields
+        )
+        pending_job.with_context(_job_edit_sentinel=pending_job.EDIT_SENTINEL).write(
+            {
+                "kwargs": kwargs,
+                "eta": fields.Datetime.now()
+                + timedelta(seconds=self._export_debounce_delay),
+            }
+        )
+        return pending_job, identity_key
+
     """
     EXECUTERS
 
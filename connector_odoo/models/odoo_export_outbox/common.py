@@ -0,0 +1,388 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from psycopg2.extras import Json, execute_values
+
+from odoo import _, api, fields, models
+
+from odoo.addons.connector.exception import RetryableJobError
+
+_logger = logging.getLogger(__name__)
+
+
+class OdooExportOutbox(models.Model):
+    """Bindings waiting for their export, one row per binding.
+
+    The rows are inserted or updated in the transaction of the change. A
+    flusher job exports them by batches, grouped by binding model, in the
+    same job and with the same connection. A row stays in the outbox until
+    the export of its binding, or the job exporting it again, is committed.
+    """
+
+    _name = "odoo.export.outbox"
+    _description = "Odoo Export Outbox"
+    _order = "id"
+
+    # Seconds before the flusher job starts, the exports of a burst are
+    # flushed together
+    _flush_delay = 5
+    # Number of rows claimed at once by the flusher
+    _flush_batch_size = 100
+    # Seconds after which the rows claimed by a flusher that never finished
+    # are claimed again
+    _claim_timeout = 3600
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    model_name = fields.Char(string="Binding Model", required=True)
+    res_id = fields.Integer(string="Binding ID", required=True)
+    export_fields = fields.Json(
+        help="Fields to export, empty to export all the fields",
+    )
+    claim_date = fields.Datetime(
+        readonly=True,
+        help="Set while a flusher exports the binding",
+    )
+
+    _sql_constraints = [
+        (
+            "backend_binding_uniq",
+            "unique(backend_id, model_name, res_id)",
+            "A binding can only be once in the outbox of a backend.",
+        )
+    ]
+
+    @api.model
+    def add(self, bindings, backend, export_fields=None):
+        """Insert the bindings in the outbox or merge the fields in their
+        rows, and make sure a flusher job is waiting.
+
+        The write date of a row changes on every call, so a flusher knows
+        when the row was changed during the export of the binding.
+
+        :param export_fields: fields to export, None for all the fields
+        """
+        if not bindings:
+            return None
+        self.flush_model()
+        execute_values(
+            self.env.cr,
+            "INSERT INTO odoo_export_outbox "
+            "(backend_id, model_name, res_id, export_fields, "
+            "create_uid, create_date, write_uid, write_date) VALUES %s "
+            "ON CONFLICT (backend_id, model_name, res_id) DO UPDATE SET "
+            "export_fields = CASE "
+            "WHEN odoo_export_outbox.export_fields IS NULL "
+            "OR EXCLUDED.export_fields IS NULL THEN NULL "
+            "ELSE (SELECT jsonb_agg(DISTINCT name ORDER BY name) FROM "
+            "jsonb_array_elements_text("
+            "odoo_export_outbox.export_fields || EXCLUDED.export_fields) name) "
+            "END, "
+            "write_uid = EXCLUDED.write_uid, write_date = EXCLUDED.write_date",
+            [
+                (
+                    backend.id,
+                    bindings._name,
+                    binding_id,
+                    Json(sorted(export_fields)) if export_fields else None,
+                    self.env.uid,
+                    self.env.uid,
+                )
+                for binding_id in bindings.ids
+            ],
+            template="(%s, %s, %s, %s, %s, "
+            "clock_timestamp() AT TIME ZONE 'UTC', %s, "
+            "clock_timestamp() AT TIME ZONE 'UTC')",
+        )
+        self.invalidate_model()
+        return self.delayed_flush(backend)
+
+    @api.model
+    def delayed_flush(self, backend):
+        """Delay the flusher job of the backend, only one waits at a time"""
+        return (
+            self.sudo()
+            .with_delay(
+                eta=self._flush_delay,
+                identity_key="odoo.export.outbox.flush(%s)" % backend.id,
+            )
+            .flush(backend)
+        )
+
+    @api.model
+    def _cron_flush(self):
+        """Delay a flusher for the backends with rows waiting.
+
+        A flusher can start before the transaction adding a row is committed
+        and miss it, the cron flushes these rows and the rows of the
+        flushers that never finished.
+        """
+        self.env.cr.execute(
+            "SELECT DISTINCT backend_id FROM odoo_export_outbox "
+            "WHERE claim_date IS NULL OR claim_date < %s",
+            (fields.Datetime.now() - timedelta(seconds=self._claim_timeout),),
+        )
+        backend_ids = [row[0] for row in self.env.cr.fetchall()]
+        for backend in self.env["odoo.backend"].browse(backend_ids):
+            self.delayed_flush(backend)
+
+    @api.model
+    def flush(self, backend):
+        """Export the bindings of the outbox by batches grouped by model.
+
+        The rows of a batch are claimed, then removed once the export of
+        their binding is committed. The bindings that fail are delayed in
+        their own export job.
+        """
+        exported = failed = 0
+        while True:
+            rows = self._claim_rows(backend)
+            if not rows:
+                break
+            groups = defaultdict(dict)
+            for row_id, model_name, res_id, export_fields, write_date in rows:
+                groups[model_name][res_id] = (row_id, export_fields, write_date)
+            for model_name, model_rows in groups.items():
+                delayed = self._export_group(backend, model_name, model_rows)
+                exported += len(model_rows) - delayed
+                failed += delayed
+        return _("Exported %s records, delayed again: %s") % (exported, failed)
+
+    @api.model
+    def _claim_rows(self, backend):
+        """Claim a batch of rows of the backend for this flusher
+
+        :return: list of ``(row id, model, binding id, fields, write date)``
+        """
+        now = fields.Datetime.now()
+        self.env.cr.execute(
+            "UPDATE odoo_export_outbox SET claim_date = %s WHERE id IN ("
+            "SELECT id FROM odoo_export_outbox WHERE backend_id = %s "
+            "AND (claim_date IS NULL OR claim_date < %s) "
+            "ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED) "
+            "RETURNING id, model_name, res_id, export_fields, write_date",
+            (
+                now,
+                backend.id,
+                now - timedelta(seconds=self._claim_timeout),
+                self._flush_batch_size,
+            ),
+        )
+        rows = self.env.cr.fetchall()
+        self.env.cr.commit()  # pylint: disable=invalid-commit
+        return rows
+
+    @api.model
+    def _release_rows(self, rows):
+        """Remove the rows of the exported bindings, the rows changed since
+        they were claimed are released for the next flush instead.
+
+        :param rows: list of ``(row id, fields, write date)`` as claimed
+        """
+        if not rows:
+            return
+        self.env.cr.execute(
+            "DELETE FROM odoo_export_outbox o "
+            "USING unnest(%s::int[], %s::timestamp[]) AS r(id, write_date) "
+            "WHERE o.id = r.id AND o.write_date = r.write_date",
+            ([row[0] for row in rows], [row[2] for row in rows]),
+        )
+        self.env.cr.execute(
+            "UPDATE odoo_export_outbox SET claim_date = NULL WHERE id = ANY(%s)",
+            ([row[0] for row in rows],),
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _export_group(self, backend, model_name, rows):
+        """Export bindings of the same model in one work context, with bulk
+        calls when the exporter of the model allows them.
+
+        :param rows: dict ``{binding id: (row id, fields, write date)}``
+        :return: the number of bindings delayed again
+        """
+        bindings = self.env[model_name].browse(list(rows)).exists()
+        # The rows of the deleted bindings have nothing to export
+        self._release_rows([rows[res_id] for res_id in set(rows) - set(bindings.ids)])
+        self.env.cr.commit()  # pylint: disable=invalid-commit
+        with backend.work_on(model_name) as work:
+            if work.component(usage="record.exporter")._bulk_export:
+                done_ids = []
+                try:
+                    self._export_bulk(work, bindings, rows, done_ids)
+                    return 0
+                except Exception as e:
+                    self.env.cr.rollback()
+                    _logger.warning(
+                        "Bulk export of %s failed in outbox, exported one by one: "
+                        "%s",
+                        model_name,
+                        e,
+                    )
+                    # The records already on Odoo are not exported again
+                    bindings = bindings.filtered(lambda b: b.id not in done_ids)
+            return self._export_one_by_one(work, bindings, rows)
+
+    @api.model
+    def _export_bulk(self, work, bindings, rows, done_ids):
+        """Export the bindings with one ``write`` call per group of records
+        with the same values and one ``create`` call for the new records.
+
+        The bindings are bound and their rows removed as soon as Odoo has
+        them, their ids are added to ``done_ids`` so a failure later does
+        not export them again.
+        """
+        adapter = work.component(usage="backend.adapter")
+        remote_records = self._read_remote_records(work, bindings)
+        to_create, to_write, to_bind, skipped_ids = [], [], [], []
+        for binding in bindings:
+            exporter = work.component(usage="record.exporter")
+            prepared = exporter.prepare_run(
+                binding, fields=rows[binding.id][1], remote_records=remote_records
+            )
+            if prepared is None:
+                skipped_ids.append(binding.id)
+                continue
+            method, data = prepared
+            if method == "create" and data:
+                to_create.append((exporter, data))
+            elif method == "write" and data:
+                to_write.append((exporter, data))
+            else:
+                to_bind.append(exporter)
+        self._lock_exporters([exporter for exporter, __ in to_write])
+        if to_write:
+            adapter.write_multi(
+                {exporter.external_id: data for exporter, data in to_write}
+            )
+        self._bind_exported(
+            rows, [exporter for exporter, __ in to_write] + to_bind, done_ids
+        )
+        self._release_rows([rows[binding_id] for binding_id in skipped_ids])
+        self.env.cr.commit()  # pylint: disable=invalid-commit
+        done_ids.extend(skipped_ids)
+        create_exporters = [exporter for exporter, __ in to_create]
+        self._lock_exporters(create_exporters)
+        # Each chunk of records is bound as soon as it is created
+        for index, external_ids in adapter.iter_create_multi(
+            [data for __, data in to_create]
+        ):
+            next_index = index + len(external_ids)
+            exporters = create_exporters[index:next_index]
+            for exporter, external_id in zip(exporters, external_ids):
+                exporter.external_id = external_id
+            self._bind_exported(rows, exporters, done_ids)
+            # The next chunk is only sent when the loop continues
+            self._lock_exporters(create_exporters[next_index:])
+        for exporter in [exporter for exporter, __ in to_write + to_create] + to_bind:
+            try:
+                exporter._after_export()
+                self.env.cr.commit()  # pylint: disable=invalid-commit
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.warning(
+                    "After export of %s(%s) failed in outbox: %s",
+                    exporter.binding._name,
+                    exporter.binding.id,
+                    e,
+                )
+                self._delay_export(
+                    work.collection, exporter.binding, rows[exporter.binding.id][1]
+                )
+                self.env.cr.commit()  # pylint: disable=invalid-commit
+
+    @api.model
+    def _lock_exporters(self, exporters):
+        """Lock the bindings of the exporters again right before they are
+        sent to Odoo: the commits of the dependencies exported by
+        :meth:`prepare_run`, and of the bindings already sent, release the
+        locks taken when they were prepared.
+
+        Raise when a binding to create was exported by a concurrent job
+        meanwhile, the bindings not sent yet are exported one by one.
+        """
+        if not exporters:
+            return
+        for exporter in exporters:
+            exporter._lock()
+        binder = exporters[0].binder
+        bindings = exporters[0].binding.browse(
+            [exporter.binding.id for exporter in exporters if not exporter.external_id]
+        )
+        bindings.invalidate_recordset([binder._external_field])
+        exported = bindings.filtered(binder._external_field)
+        if exported:
+            raise RetryableJobError(
+                "%s(%s) exported by a concurrent job"
+                % (exported._name, ", ".join(map(str, exported.ids)))
+            )
+
+    @api.model
+    def _read_remote_records(self, work, bindings):
+        """Read the write dates on Odoo of the exported bindings with one
+        call, for the check of the exporters before the export
+
+        :return: dict ``{external id: record or None when it is missing}``
+        """
+        binder = work.component(usage="binder")
+        external_ids = [
+            external_id
+            for external_id in binder.to_external_many(bindings).values()
+            if external_id
+        ]
+        if not external_ids:
+            return {}
+        adapter = work.component(usage="backend.adapter")
+        records = adapter.read_many(external_ids, fields=["write_date"])
+        return {external_id: records.get(external_id) for external_id in external_ids}
+
+    @api.model
+    def _bind_exported(self, rows, exporters, done_ids):
+        """Bind the bindings exported in bulk, remove their rows and commit"""
+        for exporter in exporters:
+            exporter.finish_run()
+        binding_ids = [exporter.binding.id for exporter in exporters]
+        self._release_rows([rows[binding_id] for binding_id in binding_ids])
+        self.env.cr.commit()  # pylint: disable=invalid-commit
+        done_ids.extend(binding_ids)
+
+    @api.model
+    def _export_one_by_one(self, work, bindings, rows):
+        """Export the bindings one by one, each export is committed.
+
+        :return: the number of bindings delayed again
+        """
+        failed = 0
+        for binding in bindings:
+            export_fields = rows[binding.id][1]
+            try:
+                exporter = work.component(usage="record.exporter")
+                exporter.run(binding, fields=export_fields)
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.warning(
+                    "Export of %s(%s) failed in outbox: %s",
+                    binding._name,
+                    binding.id,
+                    e,
+                )
+                self._delay_export(work.collection, binding, export_fields)
+                failed += 1
+            # A flusher killed before this commit exports the binding again
+            self._release_rows([rows[binding.id]])
+            self.env.cr.commit()  # pylint: disable=invalid-commit
+        return failed
+
+    @api.model
+    def _delay_export(self, backend, binding, export_fields):
+        """Export the binding again in its own job"""
+        return binding.with_delay(
+            channel=binding._unique_channel_name,
+            priority=binding._priority,
+        ).export_record(backend, fields=export_fields)
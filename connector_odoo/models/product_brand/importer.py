@@ -18,18 +18,6 @@ class ProductBrandBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.product.brand"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        updated_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo product brands %s returned %s items",
-            domain,
-            len(updated_ids),
-        )
-        for cat in updated_ids:
-            self._import_record(cat, force=force)
-
 
 class ProductBrandImporter(Component):
     _name = "odoo.product.brand.importer"
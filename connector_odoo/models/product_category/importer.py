@@ -15,27 +15,14 @@ _logger = logging.getLogger(__name__)
 class ProductCategoryBatchImporter(Component):
     """Import the Odoo Product Categories.
 
-    For every product category in the list, a delayed job is created.
-    A priority is set on the jobs according to their level to rise the
-    chance to have the top level categories imported first.
+    The categories are imported level by level, the top level categories
+    first.
     """
 
     _name = "odoo.product.category.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.hierarchy.batch.importer"
     _apply_on = ["odoo.product.category"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        updated_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo product categories %s returned %s items",
-            domain,
-            len(updated_ids),
-        )
-        for cat in updated_ids:
-            self._import_record(cat, force=force)
-
 
 class ProductCategoryImporter(Component):
     _name = "odoo.product.category.importer"
@@ -69,7 +56,10 @@ class ProductCategoryImporter(Component):
     def _after_import(self, binding, force=False):
         """Hook called at the end of the import"""
         self._sync_public_category(binding)
-        binding._parent_store_compute()
+        # The hierarchy batch importers recompute the parent store at the end
+        if not self.work.defer_parent_store:
+            binding.odoo_id._parent_store_update()
+            self.model.delayed_recompute_parent_store()
         return super()._after_import(binding, force)
 
     def _translate_fields(self, binding):
@@ -121,7 +111,7 @@ class ProductCategoryImporter(Component):
                 binding,
             )
         public_categ_id._compute_product_tmpls()
-        public_categ_id._parent_store_compute()
+        public_categ_id._parent_store_update()
         return True
 
 
@@ -153,11 +143,11 @@ class ProductCategoryImportMapper(Component):
         if feature_icons := record.get("feature_icon_ids"):
             icon_ids = []
             binder = self.binder_for("odoo.feature.icon")
-            for icon in feature_icons:
-                local_icon_id = binder.to_internal(icon, unwrap=True)
+            local_icons = binder.to_internal_many(feature_icons, unwrap=True)
+            for icon, local_icon_id in local_icons.items():
                 if not local_icon_id:
                     raise MappingError(
-                        "The feature icon with Odoo id %s is not imported." % icon.id
+                        "The feature icon with Odoo id %s is not imported." % icon
                     )
                 icon_ids.append(local_icon_id.id)
 
@@ -170,8 +160,8 @@ class ProductCategoryImportMapper(Component):
         if table_attr_lines := record.get("catalog_attribute_lines"):
             line_ids = []
             binder = self.binder_for("odoo.product.category.table.attribute.lines")
-            for line in table_attr_lines:
-                local_line_id = binder.to_internal(line, unwrap=True)
+            local_lines = binder.to_internal_many(table_attr_lines, unwrap=True)
+            for line, local_line_id in local_lines.items():
                 if not local_line_id:
                     raise MappingError(
                         "The table attribute line with Odoo id %s is not imported."
@@ -14,18 +14,6 @@ class ProductCategoryTableAttributeLinesBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.product.category.table.attribute.lines"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo catalog table attribute lines error %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class ProductCategoryTableAttributeLinesMapper(Component):
     _name = "odoo.product.category.table.attribute.lines.mapper"
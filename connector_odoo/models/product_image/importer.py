@@ -74,11 +74,13 @@ class ProductImageImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = ["odoo.product.image"]
 
-    def run(self, external_id, force=False):
+    def run(self, external_id, force=False, odoo_record=None):
         """Map base_multi_image.image to product.image before import"""
 
         self.backend_adapter._odoo_model = "base_multi_image.image"
-        super(ProductImageImporter, self).run(external_id, force=force)
+        super(ProductImageImporter, self).run(
+            external_id, force=force, odoo_record=odoo_record
+        )
 
     # FIXUP: We shouldn't skip the import. The record could be updated.
     # def _must_skip(
@@ -91,16 +91,3 @@ class ProductPricelistItemAdapter(Component):
 
     # Set get_passive to True to get the passive records also.
     _get_passive = False
-
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
-
-        return super(ProductPricelistItemAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
@@ -14,26 +14,14 @@ _logger = logging.getLogger(__name__)
 class ProductPricelistBatchImporter(Component):
     """Import the Odoo Product Pricelists.
 
-    For every product pricelist in the list, a delayed job is created.
-    A priority is set on the jobs according to their level to rise the
-    chance to have the top level pricelist imported first.
+    The pricelists are imported level by level, the alternate pricelists
+    first.
     """
 
     _name = "odoo.product.pricelist.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.hierarchy.batch.importer"
     _apply_on = ["odoo.product.pricelist"]
-
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        updated_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo product pricelist %s returned %s items",
-            domain,
-            len(updated_ids),
-        )
-        for pricelist in updated_ids:
-            self._import_record(pricelist, force=force)
+    _parent_field = "alternate_pricelist_id"
 
 
 class ProductPricelistImporter(Component):
@@ -93,24 +81,13 @@ class ProductPricelistImportMapper(Component):
 class ProductPricelistItemBatchImporter(Component):
     """Import the Odoo Product Pricelist Items.
 
-    For every pricelist item in the list, a delayed job is created.
+    The items are imported by pages in the batch job.
     """
 
     _name = "odoo.product.pricelist.item.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.bulk.batch.importer"
     _apply_on = ["odoo.product.pricelist.item"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-        updated_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo product pricelist item %s returned %s items",
-            domain,
-            len(updated_ids),
-        )
-        for pricelist in updated_ids:
-            self._import_record(pricelist, force=force)
-
 
 class ProductPricelistItemImporter(Component):
     _name = "odoo.product.pricelist.item.importer"
@@ -14,6 +14,7 @@ _logger = logging.getLogger(__name__)
 
 class OdooProductProduct(models.Model):
     _queue_priority = 4
+    _export_outbox = True
     _name = "odoo.product.product"
     _inherit = "odoo.binding"
     _inherits = {"product.product": "odoo_id"}
@@ -84,17 +85,57 @@ class ProductProductAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
+    # Fields used by the ``@mapping`` methods and the importer, the ``direct``
+    # mappings are added from the import mapper.
+    _read_fields_from_mapper = True
+    _read_fields = [
+        "attr_price",
+        "attribute_value_ids",
+        "barcode",
+        "categ_id",
+        "default_code",
+        "dimensional_uom_id",
+        "name",
+        "product_height",
+        "product_length",
+        "product_tmpl_id",
+        "product_width",
+        "taxes_id",
+        "uom_id",
+        "v_cari_urun",
+        "volume",
+        "volume_uom_id",
+        "weight",
+        "weight_uom_id",
+    ]
+
+    def _get_read_fields(self):
+        read_fields = super(ProductProductAdapter, self)._get_read_fields()
+        if self.backend_record.version in ("6.1", "7.0", "8.0"):
+            # The barcode was named ean13 before 9.0
+            read_fields = sorted(set(read_fields) - {"barcode"} | {"ean13"})
+        return read_fields
+
+    def _get_lazy_binary_fields(self):
+        lazy_fields = super(ProductProductAdapter, self)._get_lazy_binary_fields()
+        if self.backend_record.version in (
+            "6.1",
+            "7.0",
+            "8.0",
+            "9.0",
+            "10.0",
+            "11.0",
+            "12.0",
+        ):
+            lazy_fields["image_main"] = "image_1920"
+        else:
+            lazy_fields["image_1920"] = "image_1920"
+        return lazy_fields
+
+    def _get_search_domain(self, domain=None):
+        """Add the external domain filter of the backend"""
+        domain = super(ProductProductAdapter, self)._get_search_domain(domain)
         ext_filter = ast.literal_eval(
             str(self.backend_record.external_product_domain_filter)
         )
-        domain += ext_filter
-        return super(ProductProductAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
+        return domain + (ext_filter or [])
@@ -45,15 +45,17 @@ class BatchProductExporter(Component):
                 ("backend_id", "=", self.backend_record.id),
             ]
         )
+        # The exports go through the outbox and are flushed by its own jobs,
+        # there is no export job to give options to
         for prod in bind_ids:
-            job_options = {"max_retries": 0}
-            self._export_record(prod, job_options=job_options)
+            self._export_record(prod)
 
 
 class OdooProductExporter(Component):
     _name = "odoo.product.product.exporter"
     _inherit = "odoo.exporter"
     _apply_on = ["odoo.product.product"]
+    _bulk_export = True
 
     def _export_dependencies(self):
         categ_ids = self.binding.categ_id.bind_ids
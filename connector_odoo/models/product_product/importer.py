@@ -21,9 +21,10 @@ def _compute_attribute_line_vals(importer, record):
     if not local_template_id:
         return local_template_id, []
 
-    for attr_value_id in record["attribute_value_ids"]:
-        local_attr_val_id = attr_value_binder.to_internal(attr_value_id, unwrap=True)
-
+    local_attr_vals = attr_value_binder.to_internal_many(
+        record["attribute_value_ids"], unwrap=True
+    )
+    for attr_value_id, local_attr_val_id in local_attr_vals.items():
         if not local_attr_val_id:
             raise MappingError(
                 "Attribute not found for value %s."
@@ -46,22 +47,14 @@ def _compute_attribute_line_vals(importer, record):
 class ProductBatchImporter(Component):
     """Import the Odoo Products.
 
-    For every product category in the list, a delayed job is created.
+    The records are imported by chunks of delayed jobs.
     Import from a date
     """
 
     _name = "odoo.product.product.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.chunked.batch.importer"
     _apply_on = ["odoo.product.product"]
-
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo products %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+    _filter_uptodate = True
 
 
 class ProductImportMapper(Component):
@@ -87,11 +80,8 @@ class ProductImportMapper(Component):
     @mapping
     def taxes_id(self, record):
         binder = self.binder_for("odoo.account.tax")
-        tax_ids = []
-        for tax_id in record["taxes_id"]:
-            tax = binder.to_internal(tax_id, unwrap=True)
-            if tax:
-                tax_ids.append(tax.id)
+        taxes = binder.to_internal_many(record["taxes_id"], unwrap=True)
+        tax_ids = [tax.id for tax in taxes.values() if tax]
         return {"taxes_id": [(6, 0, tax_ids)]}
 
     @mapping
@@ -210,21 +200,6 @@ class ProductImportMapper(Component):
             )
         return {"categ_id": cat.id}
 
-    @mapping
-    def image(self, record):
-        if self.backend_record.version in (
-            "6.1",
-            "7.0",
-            "8.0",
-            "9.0",
-            "10.0",
-            "11.0",
-            "12.0",
-        ):
-            return {"image_1920": record["image_main"]}
-        else:
-            return {"image_1920": record["image_1920"]}
-
     @mapping
     def barcode(self, record):
         barcode = record.get("barcode") or record.get("ean13")
@@ -235,6 +210,7 @@ class ProductImporter(Component):
     _name = "odoo.product.product.importer"
     _inherit = "odoo.importer"
     _apply_on = ["odoo.product.product"]
+    _write_changed_fields_only = True
 
     def _must_skip(self):
         """If the product is not active and won't be active, we skip it"""
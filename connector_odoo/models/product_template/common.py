@@ -14,6 +14,8 @@ _logger = logging.getLogger(__name__)
 
 class OdooProductTemplate(models.Model):
     _queue_priority = 3
+    _queue_chunk_size = 20
+    _export_outbox = True
     _name = "odoo.product.template"
     _inherit = "odoo.binding"
     _inherits = {"product.template": "odoo_id"}
@@ -96,18 +98,54 @@ class ProductTemplateAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
+    # Fields used by the ``@mapping`` methods and the importer, the ``direct``
+    # mappings are added from the import mapper.
+    _read_fields_from_mapper = True
+    _read_fields = [
+        "accessory_product_ids",
+        "attribute_line_ids",
+        "catalog_description",
+        "categ_id",
+        "default_code",
+        "default_variant_id",
+        "dimensional_uom_id",
+        "feature_icon_ids",
+        "feature_line_ids",
+        "name",
+        "product_brand_id",
+        "product_height",
+        "product_length",
+        "product_width",
+        "public_description",
+        "taxes_id",
+        "uom_id",
+        "volume",
+        "volume_uom_id",
+        "website_attachment_ids",
+        "weight",
+        "weight_uom_id",
+    ]
 
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
+    def _get_lazy_binary_fields(self):
+        lazy_fields = super(ProductTemplateAdapter, self)._get_lazy_binary_fields()
+        if self.backend_record.version in (
+            "6.1",
+            "7.0",
+            "8.0",
+            "9.0",
+            "10.0",
+            "11.0",
+            "12.0",
+        ):
+            lazy_fields["image_main"] = "image_1920"
+        else:
+            lazy_fields["image_1920"] = "image_1920"
+        return lazy_fields
+
+    def _get_search_domain(self, domain=None):
+        """Add the external domain filter of the backend"""
+        domain = super(ProductTemplateAdapter, self)._get_search_domain(domain)
         ext_filter = ast.literal_eval(
             str(self.backend_record.external_product_template_domain_filter)
         )
-        domain += ext_filter
-        return super(ProductTemplateAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
+        return domain + (ext_filter or [])
@@ -48,17 +48,17 @@ class BatchProductTemplateExporter(Component):
                 ("backend_id", "=", self.backend_record.id),
             ]
         )
+        # The exports go through the outbox and are flushed by its own jobs,
+        # there is no export job to give options to
         for prod in bind_ids:
-            job_options = {
-                "max_retries": 0,
-            }
-            self._export_record(prod, job_options=job_options)
+            self._export_record(prod)
 
 
 class OdooProductTemplateExporter(Component):
     _name = "odoo.product.template.exporter"
     _inherit = "odoo.exporter"
     _apply_on = ["odoo.product.template"]
+    _bulk_export = True
 
     def _export_dependencies(self):
 
@@ -15,26 +15,14 @@ _logger = logging.getLogger(__name__)
 class ProductTemplateBatchImporter(Component):
     """Import the Odoo Products Template.
 
-    For every product category in the list, a delayed job is created.
+    The records are imported by chunks of delayed jobs.
     Import from a date
     """
 
     _name = "odoo.product.template.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.chunked.batch.importer"
     _apply_on = ["odoo.product.template"]
-
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo products template %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            job_options = {"priority": 15}
-            self._import_record(external_id, force=force)
+    _filter_uptodate = True
 
 
 class ProductTemplateImportMapper(Component):
@@ -92,11 +80,8 @@ class ProductTemplateImportMapper(Component):
     @mapping
     def taxes_id(self, record):
         binder = self.binder_for("odoo.account.tax")
-        tax_ids = []
-        for tax_id in record["taxes_id"]:
-            tax = binder.to_internal(tax_id, unwrap=True)
-            if tax:
-                tax_ids.append(tax.id)
+        taxes = binder.to_internal_many(record["taxes_id"], unwrap=True)
+        tax_ids = [tax.id for tax in taxes.values() if tax]
         return {"taxes_id": [(6, 0, tax_ids)]}
 
     @mapping
@@ -117,11 +102,11 @@ class ProductTemplateImportMapper(Component):
         if feature_icons := record.get("feature_icon_ids"):
             icon_ids = []
             binder = self.binder_for("odoo.feature.icon")
-            for icon in feature_icons:
-                local_icon_id = binder.to_internal(icon, unwrap=True)
+            local_icons = binder.to_internal_many(feature_icons, unwrap=True)
+            for icon, local_icon_id in local_icons.items():
                 if not local_icon_id:
                     raise MappingError(
-                        "The feature icon with Odoo id %s is not imported." % icon.id
+                        "The feature icon with Odoo id %s is not imported." % icon
                     )
                 icon_ids.append(local_icon_id.id)
 
@@ -167,21 +152,6 @@ class ProductTemplateImportMapper(Component):
 
         return vals
 
-    @mapping
-    def image(self, record):
-        if self.backend_record.version in (
-            "6.1",
-            "7.0",
-            "8.0",
-            "9.0",
-            "10.0",
-            "11.0",
-            "12.0",
-        ):
-            return {"image_1920": record["image_main"]}
-        else:
-            return {"image_1920": record["image_1920"]}
-
     @mapping
     def public_description(self, record):
         """Sometimes user can edit HTML field with JS editor.
@@ -227,6 +197,10 @@ class ProductTemplateImporter(Component):
     _name = "odoo.product.template.importer"
     _inherit = "odoo.importer"
     _apply_on = ["odoo.product.template"]
+    _write_changed_fields_only = True
+    # The attachments, lines and accessories are imported by their own jobs
+    # and linked to the template once they exist
+    _after_import_when_unchanged = True
 
     def _import_dependencies(self, force=False):
         """Import the dependencies for the record"""
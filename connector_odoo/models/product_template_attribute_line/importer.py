@@ -67,8 +67,8 @@ class ProductTemplateAttributeLineMapper(Component):
     def _get_attribute_value_id(self, record):
         binder = self.binder_for("odoo.product.attribute.value")
         vals = []
-        for value_id in record["value_ids"]:
-            local_attribute_value_id = binder.to_internal(value_id, unwrap=True)
+        local_values = binder.to_internal_many(record["value_ids"], unwrap=True)
+        for value_id, local_attribute_value_id in local_values.items():
             if local_attribute_value_id:
                 vals.append(local_attribute_value_id.id)
             else:
@@ -37,11 +37,8 @@ class ProductTemplateFeatureLineMapper(Component):
 
     def _get_feature_value_id(self, record):
         binder = self.binder_for("odoo.product.attribute.value")
-        vals = []
-        for value_id in record["value_ids"]:
-            local_feature_value_id = binder.to_internal(value_id, unwrap=True).id
-            vals.append(local_feature_value_id)
-        return vals
+        local_values = binder.to_internal_many(record["value_ids"], unwrap=True)
+        return [value.id for value in local_values.values()]
 
     @mapping
     def feature_id(self, record):
@@ -11,22 +11,9 @@ _logger = logging.getLogger(__name__)
 
 class ResCurrencyRateBatchImporter(Component):
     _name = "odoo.res.currency.rate.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.bulk.batch.importer"
     _apply_on = ["odoo.res.currency.rate"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo currency rates %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        base_priority = 10
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class ResCurrencyRateMapper(Component):
     _name = "odoo.res.currency.rate.mapper"
@@ -15,6 +15,7 @@ _logger = logging.getLogger(__name__)
 class OdooPartner(models.Model):
     _special_channel = "root.2"
     _queue_priority = 3
+    _export_outbox = True
     _name = "odoo.res.partner"
     _inherit = "odoo.binding"
     _inherits = {"res.partner": "odoo_id"}
@@ -86,21 +87,13 @@ class PartnerAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
+    def _get_search_domain(self, domain=None):
+        """Add the external domain filter of the backend"""
+        domain = super(PartnerAdapter, self)._get_search_domain(domain)
         ext_filter = ast.literal_eval(
             str(self.backend_record.external_res_partner_domain_filter)
         )
-        domain += ext_filter or []
-        return super(PartnerAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
+        return domain + (ext_filter or [])
 
 
 class PartnerListener(Component):
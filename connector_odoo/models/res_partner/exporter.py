@@ -48,15 +48,17 @@ class BatchPartnerExporter(Component):
                 ("backend_id", "=", self.backend_record.id),
             ]
         )
+        # The exports go through the outbox and are flushed by its own jobs,
+        # there is no export job to give options to
         for partner in bind_ids:
-            job_options = {"max_retries": 0}
-            self._export_record(partner, job_options=job_options)
+            self._export_record(partner)
 
 
 class OdooPartnerExporter(Component):
     _name = "odoo.res.partner.exporter"
     _inherit = "odoo.exporter"
     _apply_on = ["odoo.res.partner"]
+    _bulk_export = True
 
     # Todo: remove matching functions
 
@@ -14,22 +14,14 @@ _logger = logging.getLogger(__name__)
 class PartnerBatchImporter(Component):
     """Import the Odoo Partner.
 
-    For every partner in the list, a delayed job is created.
+    The partners are imported level by level, the parent partners first.
     Import from a date
     """
 
     _name = "odoo.res.partner.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.hierarchy.batch.importer"
     _apply_on = ["odoo.res.partner"]
-
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
-        _logger.debug(
-            "search for odoo partner %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+    _filter_uptodate = True
 
 
 class PartnerImportMapper(Component):
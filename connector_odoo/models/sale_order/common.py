@@ -21,6 +21,9 @@ class OdooSaleOrder(models.Model):
     _inherit = "odoo.binding"
     _inherits = {"sale.order": "odoo_id"}
     _description = "External Odoo Sale Order"
+    # The confirmation, cancellation... of the order are executed on Odoo by
+    # jobs delayed without eta, the export must not wait behind them
+    _export_debounce = 0
     backend_amount_total = fields.Float()
     backend_amount_tax = fields.Float()
     backend_picking_count = fields.Integer()
@@ -170,21 +173,13 @@ class SaleOrderAdapter(Component):
     # Set get_passive to True to get the passive records also.
     _get_passive = True
 
-    def search(self, domain=None, model=None, offset=0, limit=None, order=None):
-        """Search records according to some criteria
-        and returns a list of ids
-
-        :rtype: list
-        """
-        if domain is None:
-            domain = []
+    def _get_search_domain(self, domain=None):
+        """Add the external domain filter of the backend"""
+        domain = super(SaleOrderAdapter, self)._get_search_domain(domain)
         ext_filter = ast.literal_eval(
             str(self.backend_record.external_sale_order_domain_filter)
         )
-        domain += ext_filter or []
-        return super(SaleOrderAdapter, self).search(
-            domain=domain, model=model, offset=offset, limit=limit, order=order
-        )
+        return domain + (ext_filter or [])
 
 
 class SaleOrderListener(Component):
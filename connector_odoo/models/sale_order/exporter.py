@@ -16,6 +16,15 @@ class OdooSaleOrderExporter(Component):
     _inherit = "odoo.exporter"
     _apply_on = ["odoo.sale.order"]
 
+    # Send the order lines in the create or the write of the order as
+    # one2many commands, instead of exporting them one by one after it
+    _inline_order_lines = True
+
+    def __init__(self, working_context):
+        super(OdooSaleOrderExporter, self).__init__(working_context)
+        # Bindings of the lines sent with the order, bound after the export
+        self._line_bindings = None
+
     def _should_import(self):
         """Search for an existing reference on Odoo backend"""
         # This means that the exported sale order is deleted on Odoo backend.
@@ -55,10 +64,109 @@ class OdooSaleOrderExporter(Component):
         for record_partner in partner_records:
             self._export_dependency(record_partner, "odoo.res.partner")
 
+    def _get_line_bindings(self):
+        """Bindings of the order lines, the missing ones are created"""
+        binding_model = self.env["odoo.sale.order.line"]
+        line_bindings = binding_model.browse()
+        for line in self.binding.order_line:
+            line_binding = line.bind_ids.filtered(
+                lambda b: b.backend_id == self.backend_record
+            )[:1]
+            if not line_binding:
+                line_binding = (
+                    binding_model.with_context(connector_no_export=True)
+                    .sudo()
+                    .create(
+                        {
+                            "backend_id": self.backend_record.id,
+                            "odoo_id": line.id,
+                        }
+                    )
+                )
+            line_bindings |= line_binding
+        return line_bindings
+
+    def _get_order_line_commands(self, line_bindings):
+        """Map the lines with the mapper of ``odoo.sale.order.line``, as
+        ``(1, id, vals)`` for the exported lines and ``(0, 0, vals)`` for
+        the others"""
+        mapper = self.component(
+            usage="export.mapper", model_name="odoo.sale.order.line"
+        )
+        commands = []
+        for line_binding in line_bindings:
+            if line_binding.external_id:
+                vals = mapper.map_record(line_binding).values()
+            else:
+                vals = mapper.map_record(line_binding).values(for_create=True)
+            # The order is set by the command
+            vals.pop("order_id", None)
+            if line_binding.external_id:
+                commands.append((1, line_binding.external_id, vals))
+            else:
+                commands.append((0, 0, vals))
+        return commands
+
+    def _create_data(self, map_record, fields=None, **kwargs):
+        data = super(OdooSaleOrderExporter, self)._create_data(
+            map_record, fields=fields, **kwargs
+        )
+        if data and self._inline_order_lines:
+            self._line_bindings = self._get_line_bindings()
+            data["order_line"] = self._get_order_line_commands(self._line_bindings)
+        return data
+
+    def _update_data(self, map_record, fields=None, **kwargs):
+        data = super(OdooSaleOrderExporter, self)._update_data(
+            map_record, fields=fields, **kwargs
+        )
+        if (
+            data
+            and self._inline_order_lines
+            and (fields is None or "order_line" in fields)
+        ):
+            line_bindings = self._get_line_bindings()
+            # The lines not bound may already be on Odoo, they are matched
+            # by the exporter of the lines
+            if all(line_bindings.mapped("external_id")):
+                self._line_bindings = line_bindings
+                data["order_line"] = self._get_order_line_commands(line_bindings)
+        return data
+
+    def _bind_order_lines(self):
+        """Bind the lines sent with the order. The lines created by the
+        commands have the new ids of the order on Odoo, in their order."""
+        line_binder = self.binder_for("odoo.sale.order.line")
+        new_bindings = self._line_bindings.filtered(lambda b: not b.external_id)
+        for line_binding in self._line_bindings - new_bindings:
+            line_binder.bind(line_binding.external_id, line_binding)
+        if not new_bindings:
+            return
+        remote_line_ids = self.backend_adapter.read(
+            self.external_id, fields=["order_line"]
+        )["order_line"]
+        new_line_ids = sorted(
+            set(remote_line_ids) - set(self._line_bindings.mapped("external_id"))
+        )
+        if len(new_line_ids) != len(new_bindings):
+            # The lines stay unbound, the next export matches them
+            _logger.warning(
+                "Sale order %s: %s lines sent, %s new lines on Odoo, "
+                "the lines are not bound",
+                self.external_id,
+                len(new_bindings),
+                len(new_line_ids),
+            )
+            return
+        for line_binding, external_id in zip(new_bindings, new_line_ids):
+            line_binder.bind(external_id, line_binding)
+
     def _after_export(self):
         """Hook called after the export"""
         binding = self.binding
-        if binding and binding.order_line:
+        if binding and self._line_bindings is not None:
+            self._bind_order_lines()
+        elif binding and binding.order_line:
             for line in binding.order_line:
                 self._export_dependency(line, "odoo.sale.order.line")
         if binding and binding.transaction_ids:
@@ -33,14 +33,7 @@ class SaleOrderBatchImporter(Component):
             self.env["odoo.res.partner"].search([]).mapped("external_id")
         )
         domain += [("partner_id", "in", synced_partner_ext_ids)]
-        updated_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo sale orders %s returned %s items",
-            domain,
-            len(updated_ids),
-        )
-        for order_id in updated_ids:
-            self._import_record(order_id, force=force)
+        return super(SaleOrderBatchImporter, self).run(domain=domain, force=force)
 
 
 class SaleOrderImportMapper(Component):
@@ -72,11 +72,8 @@ class SaleOrderLineExportMapper(Component):
     @mapping
     def tax_id(self, record):
         binder = self.binder_for("odoo.account.tax")
-        taxes = []
-        for tax in record.tax_id:
-            external_id = binder.to_external(tax, wrap=True)
-            if external_id:
-                taxes.append(external_id)
+        external_ids = binder.to_external_many(record.tax_id, wrap=True)
+        taxes = [external_id for external_id in external_ids.values() if external_id]
         return {"tax_id": [(6, 0, taxes)]}
 
 
@@ -17,17 +17,6 @@ class UomBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.uom.uom"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-        external_ids = self.backend_adapter.search(
-            domain,
-        )
-        _logger.info(
-            "search for odoo uom %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class UomMapper(Component):
     _name = "odoo.uom.uom.mapper"
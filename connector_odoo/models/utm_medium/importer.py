@@ -11,21 +11,9 @@ _logger = logging.getLogger(__name__)
 
 class UTMMediumBatchImporter(Component):
     _name = "odoo.utm.medium.batch.importer"
-    _inherit = "odoo.delayed.batch.importer"
+    _inherit = "odoo.bulk.batch.importer"
     _apply_on = ["odoo.utm.medium"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo utm medium %s returned %s items",
-            domain,
-            len(external_ids),
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
-
 
 class UTMMediumMapper(Component):
     _name = "odoo.utm.medium.mapper"
@@ -54,15 +42,16 @@ class UTMMediumImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = "odoo.utm.medium"
 
-    def _create(self, data):
+    def _create_data(self, map_record, **kwargs):
         """
         When creating new binding, if there is any odoo_id, we should remove all the
         keys and just keep the odoo_id key. So it means we would create a new binding
         for the odoo_id.
         """
+        data = super(UTMMediumImporter, self)._create_data(map_record, **kwargs)
         if data.get("odoo_id"):
             data = {
                 "odoo_id": data["odoo_id"],
                 "backend_id": self.backend_record.id,
             }
-        return super(UTMMediumImporter, self)._create(data)
+        return data
@@ -0,0 +1,10 @@
+from . import test_export_outbox
+from . import test_export_debounce
+from . import test_import_sync_hash
+from . import test_import_same_value
+from . import test_sale_order_export
+from . import test_odoo_api
+from . import test_batch_import
+from . import test_binder
+from . import test_bulk_import
+from . import test_hierarchy_import
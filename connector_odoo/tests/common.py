@@ -0,0 +1,57 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from odoo.tests.common import TransactionCase
+
+from odoo.addons.connector_odoo.components.binder import get_binder_cache
+
+
+class OdooConnectorCase(TransactionCase):
+    """Base class of the connector tests.
+
+    The backend has no connection, ``get_connection`` returns a mock. The
+    commits and rollbacks of the importers and exporters are disabled, so
+    the changes of a test stay in its transaction.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(
+            context=dict(
+                cls.env.context, tracking_disable=True, connector_no_export=True
+            )
+        )
+        cls.backend = cls.env["odoo.backend"].create(
+            {
+                "name": "Test Backend",
+                "version": "12.0",
+                "login": "admin",
+                "password": "admin",
+                "database": "test",
+                "hostname": "odoo.test",
+            }
+        )
+        cls.env.company.default_odoo_backend_id = cls.backend
+
+    def setUp(self):
+        super().setUp()
+        self.odoo_api = mock.MagicMock()
+        for patcher in (
+            mock.patch.object(
+                type(self.env["odoo.backend"]),
+                "get_connection",
+                return_value=self.odoo_api,
+            ),
+            mock.patch.object(type(self.env.cr), "commit"),
+            mock.patch.object(type(self.env.cr), "rollback"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # The binder lookups cached by the cursor don't outlive a test
+        get_binder_cache(self.env.cr)["bindings"].clear()
+
+    def _get_jobs(self, model_name, method_name):
+        return self.env["queue.job"].search(
+            [("model_name", "=", model_name), ("method_name", "=", method_name)]
+        )
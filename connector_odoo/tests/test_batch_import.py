@@ -0,0 +1,84 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from .common import OdooConnectorCase
+
+
+class TestBatchImport(OdooConnectorCase):
+    """Chunked batch import, on the attachments"""
+
+    def setUp(self):
+        super().setUp()
+        self.binding_model = self.env["odoo.ir.attachment"]
+        with self.backend.work_on("odoo.ir.attachment") as work:
+            importer_class = type(work.component(usage="record.importer"))
+        patcher = mock.patch.object(importer_class, "run", autospec=True)
+        self.run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_chunk_jobs(self):
+        return self._get_jobs("odoo.ir.attachment", "import_record_chunk")
+
+    def test_run_delays_chunks(self):
+        self.odoo_api.iter_search_read.return_value = iter(
+            [{"id": external_id} for external_id in range(1, 6)]
+        )
+        with mock.patch.object(
+            type(self.binding_model), "_queue_chunk_size", 2, create=True
+        ):
+            self.binding_model.import_batch(self.backend)
+        jobs = self._get_chunk_jobs().sorted("id")
+        self.assertEqual([job.args[1] for job in jobs], [[1, 2], [3, 4], [5]])
+        # The records are read by the chunk jobs, not by the search
+        self.assertEqual(self.odoo_api.iter_search_read.call_args[1]["fields"], ["id"])
+        self.run.assert_not_called()
+
+    def test_chunk_read_at_once(self):
+        odoo_records = {1: {"id": 1, "name": "a.txt"}, 3: {"id": 3, "name": "c.txt"}}
+        self.odoo_api.read_many.return_value = odoo_records
+        self.binding_model.import_record_chunk(self.backend, [1, 2, 3])
+        self.odoo_api.read_many.assert_called_once()
+        self.assertEqual(self.odoo_api.read_many.call_args[1]["ids"], [1, 2, 3])
+        # The record missing on Odoo is read again by its importer
+        self.assertEqual(
+            [
+                (call.args[1], call.kwargs["odoo_record"])
+                for call in self.run.call_args_list
+            ],
+            [(1, odoo_records[1]), (2, None), (3, odoo_records[3])],
+        )
+
+    def test_chunk_failed_records_delayed(self):
+        self.odoo_api.read_many.return_value = {}
+
+        def run(importer, external_id, force=False, odoo_record=None):
+            if external_id == 2:
+                raise Exception("Mapping failed")
+
+        self.run.side_effect = run
+        self.binding_model.import_record_chunk(self.backend, [1, 2, 3])
+        self.assertEqual(self.run.call_count, 3)
+        job = self._get_jobs("odoo.ir.attachment", "import_record")
+        self.assertEqual(len(job), 1)
+        self.assertEqual(job.args[1], 2)
+
+    def test_failure_rolls_back_its_savepoint_only(self):
+        self.odoo_api.read_many.return_value = {}
+        visited = {}
+
+        def run(importer, external_id, force=False, odoo_record=None):
+            registry = importer.work.dependency_registry
+            visited[external_id] = set(registry["visited"])
+            self.env["utm.source"].create({"name": "Savepoint %s" % external_id})
+            registry["visited"].add(("odoo.utm.source", external_id, False))
+            if external_id == 2:
+                raise Exception("Mapping failed")
+
+        self.run.side_effect = run
+        self.binding_model.import_record_chunk(self.backend, [1, 2, 3])
+        names = self.env["utm.source"].search([("name", "=like", "Savepoint %")])
+        self.assertEqual(sorted(names.mapped("name")), ["Savepoint 1", "Savepoint 3"])
+        # The dependencies imported with the failed record are rolled back,
+        # they are imported again by the next records
+        self.assertEqual(visited[2], {("odoo.utm.source", 1, False)})
+        self.assertEqual(visited[3], set())
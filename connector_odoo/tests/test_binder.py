@@ -0,0 +1,102 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from .common import OdooConnectorCase
+
+
+class TestBinder(OdooConnectorCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.binding_model = cls.env["odoo.utm.source"]
+        cls.bindings = cls.binding_model.create(
+            [
+                {
+                    "name": "Binder Source %s" % external_id,
+                    "backend_id": cls.backend.id,
+                    "external_id": external_id,
+                }
+                for external_id in (11, 12)
+            ]
+        )
+
+    def setUp(self):
+        super().setUp()
+        model_class = type(self.binding_model)
+        patcher = mock.patch.object(
+            model_class,
+            "_get_binding_ids_by_external_id",
+            autospec=True,
+            side_effect=model_class._get_binding_ids_by_external_id,
+        )
+        self.search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_binder(self):
+        with self.backend.work_on("odoo.utm.source") as work:
+            return work.component(usage="binder")
+
+    def test_to_internal_cached(self):
+        binder = self._get_binder()
+        self.assertEqual(binder.to_internal(11), self.bindings[0])
+        self.assertEqual(binder.to_internal(11), self.bindings[0])
+        self.assertEqual(binder.to_internal(11, unwrap=True), self.bindings[0].odoo_id)
+        self.assertEqual(self.search.call_count, 1)
+        self.assertEqual(binder.get_cache_stats(), {"hits": 2, "misses": 1})
+
+    def test_unknown_id_cached(self):
+        binder = self._get_binder()
+        self.assertFalse(binder.to_internal(99))
+        self.assertFalse(binder.to_internal(99))
+        self.assertEqual(self.search.call_count, 1)
+
+    def test_bind_invalidates_lookups(self):
+        binder = self._get_binder()
+        self.assertFalse(binder.to_internal(13))
+        binding = self.binding_model.create(
+            {"name": "Binder Source 13", "backend_id": self.backend.id}
+        )
+        binder.bind(13, binding)
+        self.assertEqual(binder.to_internal(13), binding)
+        # The binding moved to another external id
+        self.assertEqual(binder.to_internal(11), self.bindings[0])
+        binder.bind(14, self.bindings[0])
+        self.assertFalse(binder.to_internal(11))
+        self.assertEqual(binder.to_internal(14), self.bindings[0])
+
+    def test_to_internal_many(self):
+        binder = self._get_binder()
+        binder.to_internal(11)
+        self.search.reset_mock()
+        result = binder.to_internal_many([12, 99, 11])
+        self.assertEqual(list(result), [12, 99, 11])
+        self.assertEqual(result[11], self.bindings[0])
+        self.assertEqual(result[12], self.bindings[1])
+        self.assertFalse(result[99])
+        # Only the ids missing from the cache are searched, at once
+        self.search.assert_called_once()
+        self.assertEqual(self.search.call_args.args[2], [12, 99])
+        self.assertEqual(
+            binder.to_internal_many([11, 12], unwrap=True)[12],
+            self.bindings[1].odoo_id,
+        )
+        self.search.assert_called_once()
+
+    def test_to_external_many(self):
+        binder = self._get_binder()
+        unbound = self.binding_model.create(
+            {"name": "Binder Source 13", "backend_id": self.backend.id}
+        )
+        bindings = self.bindings | unbound
+        self.assertEqual(
+            binder.to_external_many(bindings),
+            {self.bindings[0].id: 11, self.bindings[1].id: 12, unbound.id: None},
+        )
+        self.assertEqual(
+            binder.to_external_many(bindings.odoo_id, wrap=True),
+            {
+                self.bindings[0].odoo_id.id: 11,
+                self.bindings[1].odoo_id.id: 12,
+                unbound.odoo_id.id: None,
+            },
+        )
@@ -0,0 +1,110 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from .common import OdooConnectorCase
+
+
+class TestBulkImport(OdooConnectorCase):
+    """Bulk batch import, on the UTM sources"""
+
+    def setUp(self):
+        super().setUp()
+        self.binding_model = self.env["odoo.utm.source"]
+        self._import_page(
+            [
+                {"id": 21, "name": "Bulk Source 21"},
+                {"id": 22, "name": "Bulk Source 22"},
+            ]
+        )
+        self.bindings = self._get_bindings([21, 22])
+
+    def _import_page(self, records):
+        with self.backend.work_on("odoo.utm.source") as work:
+            return work.component(usage="batch.importer")._import_page(records)
+
+    def _get_bindings(self, external_ids):
+        with self.backend.work_on("odoo.utm.source") as work:
+            bindings = work.component(usage="binder").to_internal_many(external_ids)
+        return self.binding_model.union(*bindings.values())
+
+    def _patch(self, model_class, method_name):
+        patcher = mock.patch.object(
+            model_class,
+            method_name,
+            autospec=True,
+            side_effect=getattr(model_class, method_name),
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_create_write_split(self):
+        model_class = type(self.binding_model)
+        create = self._patch(model_class, "create")
+        write = self._patch(model_class, "write")
+        with self.backend.work_on("odoo.utm.source") as work:
+            importer_class = type(work.component(usage="record.importer"))
+        after_import = self._patch(importer_class, "_after_import")
+        failed_ids = self._import_page(
+            [
+                {"id": 21, "name": "Bulk Source 21 Renamed"},
+                {"id": 22, "name": "Bulk Source 22"},
+                {"id": 23, "name": "Bulk Source 23"},
+                {"id": 24, "name": "Bulk Source 24"},
+            ]
+        )
+        self.assertFalse(failed_ids)
+        # The new records are created together
+        create.assert_called_once()
+        self.assertEqual(
+            [vals["external_id"] for vals in create.call_args.args[1]], [23, 24]
+        )
+        # The changed binding gets its values, the unchanged one its sync
+        # date only
+        writes = {
+            tuple(call.args[0].ids): set(call.args[1]) for call in write.call_args_list
+        }
+        self.assertEqual(writes[(self.bindings[1].id,)], {"sync_date"})
+        self.assertIn("name", writes[(self.bindings[0].id,)])
+        self.assertEqual(self.bindings[0].name, "Bulk Source 21 Renamed")
+        new_bindings = self._get_bindings([23, 24])
+        self.assertEqual(len(new_bindings), 2)
+        self.assertTrue(all(new_bindings.mapped("sync_hash")))
+        self.assertEqual(
+            {call.args[1] for call in after_import.call_args_list},
+            {self.bindings[0], *new_bindings},
+        )
+
+    def test_locked_records_left_out(self):
+        def try_lock(cr, lock_name):
+            return not lock_name.endswith(", 24)")
+
+        with mock.patch(
+            "odoo.addons.connector_odoo.components.importer."
+            "pg_try_advisory_xact_lock",
+            side_effect=try_lock,
+        ):
+            failed_ids = self._import_page(
+                [
+                    {"id": 23, "name": "Bulk Source 23"},
+                    {"id": 24, "name": "Bulk Source 24"},
+                ]
+            )
+        self.assertEqual(failed_ids, [24])
+        self.assertTrue(self._get_bindings([23]))
+        self.assertFalse(self._get_bindings([24]))
+
+    def test_failed_page_imported_one_by_one(self):
+        with mock.patch.object(
+            type(self.env["odoo.utm.source"]),
+            "create",
+            autospec=True,
+            side_effect=Exception("Bulk create failed"),
+        ):
+            failed_ids = self._import_page(
+                [
+                    {"id": 23, "name": "Bulk Source 23"},
+                    {"id": 24, "name": "Bulk Source 24"},
+                ]
+            )
+        # The record importers fail the same way, the records are returned
+        self.assertEqual(failed_ids, [23, 24])
@@ -0,0 +1,66 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from odoo import fields
+
+from .common import OdooConnectorCase
+
+
+class TestExportDebounce(OdooConnectorCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        partner = cls.env["res.partner"].create({"name": "Debounce Partner"})
+        order = cls.env["sale.order"].create({"partner_id": partner.id})
+        cls.binding = cls.env["odoo.sale.order"].create(
+            {"backend_id": cls.backend.id, "odoo_id": order.id}
+        )
+
+    def _get_export_jobs(self):
+        return self._get_jobs("odoo.sale.order", "export_record")
+
+    def test_fields_merged_in_pending_job(self):
+        self.binding.delayed_export_record(self.backend, fields=["name"])
+        self.binding.delayed_export_record(
+            self.backend, fields=["client_order_ref", "name"]
+        )
+        job = self._get_export_jobs()
+        self.assertEqual(len(job), 1)
+        self.assertEqual(job.kwargs["fields"], ["client_order_ref", "name"])
+
+    def test_all_fields_merged(self):
+        self.binding.delayed_export_record(self.backend, fields=["name"])
+        self.binding.delayed_export_record(self.backend)
+        self.binding.delayed_export_record(self.backend, fields=["note"])
+        job = self._get_export_jobs()
+        self.assertEqual(len(job), 1)
+        self.assertIsNone(job.kwargs["fields"])
+
+    def test_pending_job_postponed(self):
+        with mock.patch.object(type(self.binding), "_export_debounce", 10):
+            self.binding.delayed_export_record(self.backend, fields=["name"])
+            job = self._get_export_jobs()
+            job.eta = fields.Datetime.now()
+            self.binding.delayed_export_record(self.backend, fields=["note"])
+        self.assertGreater(job.eta, fields.Datetime.now())
+
+    def test_sale_order_export_not_delayed(self):
+        """The jobs confirming the orders on Odoo wait for no debounce"""
+        self.binding.delayed_export_record(self.backend, fields=["name"])
+        self.assertFalse(self._get_export_jobs().eta)
+
+    def test_started_job_not_merged(self):
+        self.binding.delayed_export_record(self.backend, fields=["name"])
+        started_job = self._get_export_jobs()
+        started_job.state = "started"
+        self.env.flush_all()
+        self.binding.delayed_export_record(self.backend, fields=["note"])
+        next_job = self._get_export_jobs() - started_job
+        self.assertEqual(len(next_job), 1)
+        self.assertNotEqual(next_job.identity_key, started_job.identity_key)
+        self.assertEqual(started_job.kwargs["fields"], ["name"])
+        self.assertEqual(next_job.kwargs["fields"], ["note"])
+        # The next exports are merged in the job following the started one
+        self.binding.delayed_export_record(self.backend, fields=["client_order_ref"])
+        self.assertEqual(self._get_export_jobs(), started_job | next_job)
+        self.assertEqual(next_job.kwargs["fields"], ["client_order_ref", "note"])
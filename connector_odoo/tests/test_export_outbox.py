@@ -0,0 +1,145 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from odoo.addons.connector.exception import RetryableJobError
+
+from .common import OdooConnectorCase
+
+
+class TestExportOutbox(OdooConnectorCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.outbox = cls.env["odoo.export.outbox"]
+        partners = cls.env["res.partner"].create(
+            [{"name": "Outbox Partner 1"}, {"name": "Outbox Partner 2"}]
+        )
+        cls.bindings = cls.env["odoo.res.partner"].create(
+            [
+                {"backend_id": cls.backend.id, "odoo_id": partner.id}
+                for partner in partners
+            ]
+        )
+        cls.binding = cls.bindings[0]
+
+    def _claim(self):
+        """Claim the rows like the flusher, grouped by binding"""
+        return {
+            res_id: (row_id, export_fields, write_date)
+            for row_id, __, res_id, export_fields, write_date in (
+                self.outbox._claim_rows(self.backend)
+            )
+        }
+
+    def _get_rows(self):
+        return self.outbox.search(
+            [
+                ("backend_id", "=", self.backend.id),
+                ("model_name", "=", "odoo.res.partner"),
+            ]
+        )
+
+    def test_add_merges_fields(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        self.outbox.add(self.binding, self.backend, ["email", "name"])
+        row = self._get_rows()
+        self.assertEqual(len(row), 1)
+        self.assertEqual(row.export_fields, ["email", "name"])
+        self.outbox.add(self.binding, self.backend)
+        self.assertIsNone(self._get_rows().export_fields)
+        self.outbox.add(self.binding, self.backend, ["phone"])
+        self.assertIsNone(self._get_rows().export_fields)
+        # A single flusher waits for the backend
+        self.assertEqual(len(self._get_jobs("odoo.export.outbox", "flush")), 1)
+
+    def test_claimed_rows_skipped(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        self.assertEqual(list(self._claim()), [self.binding.id])
+        self.assertFalse(self._claim())
+
+    def test_export_one_by_one_removes_rows(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        rows = self._claim()
+        work = mock.MagicMock(collection=self.backend)
+        exporter = work.component.return_value
+        failed = self.outbox._export_one_by_one(work, self.binding, rows)
+        self.assertEqual(failed, 0)
+        exporter.run.assert_called_once_with(self.binding, fields=["name"])
+        self.assertFalse(self._get_rows())
+
+    def test_export_one_by_one_failure_delays_export(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        rows = self._claim()
+        work = mock.MagicMock(collection=self.backend)
+        work.component.return_value.run.side_effect = Exception("Connection lost")
+        failed = self.outbox._export_one_by_one(work, self.binding, rows)
+        self.assertEqual(failed, 1)
+        self.assertFalse(self._get_rows())
+        job = self._get_jobs("odoo.res.partner", "export_record")
+        self.assertEqual(len(job), 1)
+        self.assertEqual(job.records, self.binding)
+        self.assertEqual(job.kwargs["fields"], ["name"])
+
+    def test_row_changed_during_export_kept(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        rows = self._claim()
+
+        def run(binding, fields=None):
+            # The binding is changed while it is exported
+            self.outbox.add(binding, self.backend, ["email"])
+
+        work = mock.MagicMock(collection=self.backend)
+        work.component.return_value.run.side_effect = run
+        self.outbox._export_one_by_one(work, self.binding, rows)
+        row = self._get_rows()
+        self.assertEqual(len(row), 1)
+        self.assertEqual(row.export_fields, ["email", "name"])
+        self.assertFalse(row.claim_date)
+        # The next flush claims it again
+        self.assertEqual(list(self._claim()), [self.binding.id])
+
+    def test_bulk_failure_exports_remaining_bindings(self):
+        self.outbox.add(self.bindings, self.backend, ["name"])
+        rows = self._claim()
+        outbox_class = type(self.outbox)
+
+        def export_bulk(work, bindings, rows, done_ids):
+            done_ids.append(self.bindings[0].id)
+            raise Exception("Bulk write failed")
+
+        with mock.patch.object(
+            outbox_class, "_export_bulk", side_effect=export_bulk
+        ), mock.patch.object(
+            outbox_class, "_export_one_by_one", return_value=0
+        ) as export_one_by_one:
+            self.outbox._export_group(self.backend, "odoo.res.partner", rows)
+        exported = export_one_by_one.call_args[0][1]
+        self.assertEqual(exported, self.bindings[1])
+
+    def test_lock_exporters_detects_concurrent_create(self):
+        exporter = mock.MagicMock(binding=self.binding, external_id=False)
+        exporter.binder._external_field = "external_id"
+        self.outbox._lock_exporters([exporter])
+        exporter._lock.assert_called_once_with()
+        # A concurrent job created the record on Odoo and committed
+        self.env.cr.execute(
+            "UPDATE %s SET external_id = 7 WHERE id = %%s" % self.binding._table,
+            (self.binding.id,),
+        )
+        with self.assertRaises(RetryableJobError):
+            self.outbox._lock_exporters([exporter])
+
+    def test_deleted_binding_row_removed(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        rows = self._claim()
+        self.binding.unlink()
+        with mock.patch.object(type(self.outbox), "_export_bulk") as export_bulk:
+            self.outbox._export_group(self.backend, "odoo.res.partner", rows)
+        self.assertFalse(export_bulk.call_args[0][1])
+        self.assertFalse(self._get_rows())
+
+    def test_cron_flush_delays_flusher(self):
+        self.outbox.add(self.binding, self.backend, ["name"])
+        self._get_jobs("odoo.export.outbox", "flush").unlink()
+        self.outbox._cron_flush()
+        self.assertEqual(len(self._get_jobs("odoo.export.outbox", "flush")), 1)
@@ -0,0 +1,54 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from .common import OdooConnectorCase
+
+
+class TestHierarchyImport(OdooConnectorCase):
+    """Level by level batch import, on the product categories"""
+
+    def setUp(self):
+        super().setUp()
+        self.binding_model = self.env["odoo.product.category"]
+        self.odoo_api.iter_search_read.return_value = iter(
+            [
+                {"id": 4, "parent_id": [2, "All / Sub"], "write_date": False},
+                {"id": 2, "parent_id": [1, "All"], "write_date": False},
+                {"id": 3, "parent_id": [1, "All"], "write_date": False},
+                {"id": 1, "parent_id": False, "write_date": False},
+                # The parent is not imported, the record is a root
+                {"id": 5, "parent_id": [9, "Other"], "write_date": False},
+            ]
+        )
+
+    def _get_levels(self, records):
+        with self.backend.work_on("odoo.product.category") as work:
+            return work.component(usage="batch.importer")._get_levels(records)
+
+    def test_levels_roots_first(self):
+        with self.backend.work_on("odoo.product.category") as work:
+            importer = work.component(usage="batch.importer")
+            levels = importer._get_levels_to_import(None)
+        self.assertEqual(levels, [[1, 5], [2, 3], [4]])
+
+    def test_levels_cycle_cut(self):
+        levels = self._get_levels(
+            [
+                {"id": 1, "parent_id": [3, "C"]},
+                {"id": 2, "parent_id": [1, "A"]},
+                {"id": 3, "parent_id": [2, "B"]},
+                {"id": 4, "parent_id": [3, "C"]},
+            ]
+        )
+        # The cycle is cut above the first record read, 1
+        self.assertEqual(levels, [[2], [3], [1, 4]])
+
+    def test_run_chains_levels(self):
+        self.binding_model.import_batch(self.backend)
+        jobs = self._get_jobs("odoo.product.category", "import_record_chunk")
+        levels = {tuple(job.args[1]): job for job in jobs}
+        self.assertEqual(sorted(levels), [(1, 5), (2, 3), (4,)])
+        # The jobs of a level wait for the ones of the previous level
+        self.assertEqual(levels[(1, 5)].state, "pending")
+        self.assertEqual(levels[(2, 3)].state, "wait_dependencies")
+        self.assertEqual(levels[(4,)].state, "wait_dependencies")
+        recompute = self._get_jobs("odoo.product.category", "recompute_parent_store")
+        self.assertEqual(recompute.state, "wait_dependencies")
@@ -0,0 +1,86 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import datetime
+
+from .common import OdooConnectorCase
+
+
+class TestImportSameValue(OdooConnectorCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.partner = cls.env["res.partner"].create({"name": "Same Value Partner"})
+        cls.tag = cls.env["crm.tag"].create({"name": "Same Value Tag"})
+        order = cls.env["sale.order"].create(
+            {
+                "partner_id": cls.partner.id,
+                "validity_date": False,
+                "note": "<p>Fragile</p>",
+            }
+        )
+        cls.binding = cls.env["odoo.sale.order"].create(
+            {
+                "backend_id": cls.backend.id,
+                "odoo_id": order.id,
+                "backend_amount_total": 10.0,
+                "backend_picking_count": 2,
+            }
+        )
+
+    def _is_same_value(self, field_name, value):
+        with self.backend.work_on("odoo.sale.order") as work:
+            importer = work.component(usage="record.importer")
+            field = self.binding._fields[field_name]
+            return importer._is_same_value(self.binding, field, value)
+
+    def test_empty_date(self):
+        self.assertTrue(self._is_same_value("validity_date", False))
+        self.assertFalse(self._is_same_value("validity_date", "2024-01-01"))
+        self.binding.validity_date = datetime.date(2024, 1, 1)
+        self.assertTrue(self._is_same_value("validity_date", "2024-01-01"))
+        self.assertFalse(self._is_same_value("validity_date", False))
+
+    def test_empty_datetime(self):
+        self.assertTrue(self._is_same_value("backend_date_order", False))
+        self.assertFalse(
+            self._is_same_value("backend_date_order", "2024-01-01 10:00:00")
+        )
+        self.binding.backend_date_order = datetime.datetime(2024, 1, 1, 10)
+        self.assertTrue(
+            self._is_same_value("backend_date_order", "2024-01-01 10:00:00")
+        )
+
+    def test_many2one(self):
+        self.assertTrue(self._is_same_value("partner_id", self.partner.id))
+        self.assertTrue(self._is_same_value("partner_id", self.partner))
+        self.assertFalse(self._is_same_value("partner_id", False))
+
+    def test_many2many(self):
+        self.assertTrue(self._is_same_value("tag_ids", [(6, 0, [])]))
+        self.assertTrue(self._is_same_value("tag_ids", False))
+        self.assertTrue(self._is_same_value("tag_ids", []))
+        self.assertFalse(self._is_same_value("tag_ids", [(6, 0, [self.tag.id])]))
+        self.binding.tag_ids = self.tag
+        self.assertTrue(self._is_same_value("tag_ids", [(6, 0, [self.tag.id])]))
+        self.assertTrue(self._is_same_value("tag_ids", [(5,), (4, self.tag.id)]))
+        self.assertFalse(self._is_same_value("tag_ids", False))
+        # Commands which don't replace the relation are always written
+        self.assertFalse(self._is_same_value("tag_ids", [(4, self.tag.id)]))
+
+    def test_numbers(self):
+        self.assertTrue(self._is_same_value("backend_amount_total", 10.0000000001))
+        self.assertFalse(self._is_same_value("backend_amount_total", 10.01))
+        self.assertTrue(self._is_same_value("backend_picking_count", 2))
+        self.assertFalse(self._is_same_value("backend_picking_count", False))
+
+    def test_html(self):
+        self.assertTrue(self._is_same_value("note", "<p>Fragile</p>"))
+        self.assertFalse(self._is_same_value("note", "<p>Handle with care</p>"))
+
+    def test_char(self):
+        self.assertTrue(self._is_same_value("client_order_ref", False))
+        self.assertTrue(self._is_same_value("client_order_ref", ""))
+        self.assertFalse(self._is_same_value("client_order_ref", "PO-1"))
+
+    def test_binary(self):
+        self.assertTrue(self._is_same_value("signature", False))
+        self.assertFalse(self._is_same_value("signature", "aGVsbG8="))
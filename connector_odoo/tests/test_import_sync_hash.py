@@ -0,0 +1,64 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from .common import OdooConnectorCase
+
+
+class TestImportSyncHash(OdooConnectorCase):
+    def setUp(self):
+        super().setUp()
+        self.odoo_record = {
+            "id": 42,
+            "name": "Sync Hash Source",
+            "write_date": "2024-01-01 10:00:00",
+        }
+
+    def _import(self, odoo_record):
+        """Import the record, forced so the sync date doesn't skip it
+
+        :return: tuple ``(result, whether the binding was written)``
+        """
+        with self.backend.work_on("odoo.utm.source") as work:
+            importer = work.component(usage="record.importer")
+            importer_class = type(importer)
+            with mock.patch.object(
+                importer_class,
+                "_update",
+                autospec=True,
+                side_effect=importer_class._update,
+            ) as update:
+                result = importer.run(42, force=True, odoo_record=odoo_record)
+        return result, update.called
+
+    def _get_binding(self):
+        return self.env["odoo.utm.source"].search(
+            [("backend_id", "=", self.backend.id), ("external_id", "=", 42)]
+        )
+
+    def test_unchanged_record_not_written(self):
+        self._import(dict(self.odoo_record))
+        binding = self._get_binding()
+        self.assertTrue(binding.sync_hash)
+        sync_hash = binding.sync_hash
+        # Only the write date changed on Odoo
+        odoo_record = dict(self.odoo_record, write_date="2024-01-02 10:00:00")
+        result, written = self._import(odoo_record)
+        self.assertEqual(result, "Unchanged.")
+        self.assertFalse(written)
+        self.assertEqual(binding.sync_hash, sync_hash)
+
+    def test_changed_mapped_field_written(self):
+        self._import(dict(self.odoo_record))
+        binding = self._get_binding()
+        sync_hash = binding.sync_hash
+        __, written = self._import(dict(self.odoo_record, name="Renamed Source"))
+        self.assertTrue(written)
+        self.assertEqual(binding.name, "Renamed Source")
+        self.assertNotEqual(binding.sync_hash, sync_hash)
+
+    def test_changed_unmapped_field_written(self):
+        """The fields read for the after import change the hash too"""
+        self._import(dict(self.odoo_record, line_ids=[1, 2]))
+        result, written = self._import(dict(self.odoo_record, line_ids=[1, 2, 3]))
+        self.assertTrue(written)
+        self.assertNotEqual(result, "Unchanged.")
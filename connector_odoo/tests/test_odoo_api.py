@@ -0,0 +1,92 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from odoo.addons.connector_odoo.components.odoo_api import OdooAPI
+
+from .common import OdooConnectorCase
+
+
+class TestOdooAPI(OdooConnectorCase):
+    def setUp(self):
+        super().setUp()
+        self.api = OdooAPI("http://odoo.test", "test", "admin", "admin", uid=2)
+        self.addCleanup(self.api.close)
+        self.remote_ids = list(range(1, 8))
+        patcher = mock.patch.object(self.api, "_post", side_effect=self._post)
+        self.post = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _post(self, payload):
+        """Answer the ``search_read`` calls with the records of
+        ``remote_ids``, filtered on their id"""
+        __, __, __, __, method, (domain,), options = payload["params"]["args"]
+        self.assertEqual(method, "search_read")
+        records = [{"id": remote_id} for remote_id in self.remote_ids]
+        for leaf in domain:
+            if not isinstance(leaf, list):
+                continue
+            __, operator, value = leaf
+            if operator == ">":
+                records = [record for record in records if record["id"] > value]
+            elif operator == "in":
+                records = [record for record in records if record["id"] in value]
+        return records[: options.get("limit")]
+
+    def _get_calls(self):
+        """Return the ``(domain, options)`` of the calls to Odoo"""
+        return [
+            tuple(call.args[0]["params"]["args"][5:7])
+            for call in self.post.call_args_list
+        ]
+
+    def test_iter_search_read_pages_by_id(self):
+        records = self.api.iter_search_read(
+            "res.partner", [["active", "=", True]], fields=["name"], page_size=3
+        )
+        self.assertEqual([record["id"] for record in records], self.remote_ids)
+        calls = self._get_calls()
+        self.assertEqual(
+            [domain for (domain,), __ in calls],
+            [
+                [["active", "=", True], ["id", ">", 0]],
+                [["active", "=", True], ["id", ">", 3]],
+                [["active", "=", True], ["id", ">", 6]],
+            ],
+        )
+        for __, options in calls:
+            self.assertEqual(options["order"], "id")
+            self.assertEqual(options["limit"], 3)
+            self.assertEqual(options["offset"], 0)
+            self.assertEqual(options["fields"], ["name", "id"])
+
+    def test_iter_search_read_full_last_page(self):
+        self.remote_ids = list(range(1, 7))
+        records = self.api.iter_search_read("res.partner", [], page_size=3)
+        self.assertEqual([record["id"] for record in records], self.remote_ids)
+        self.assertEqual(
+            [domain for (domain,), __ in self._get_calls()],
+            [[["id", ">", 0]], [["id", ">", 3]], [["id", ">", 6]]],
+        )
+
+    def test_iter_search_read_reads_pages_on_demand(self):
+        records = self.api.iter_search_read("res.partner", [], page_size=3)
+        self.assertEqual(next(records)["id"], 1)
+        self.assertEqual(self.post.call_count, 1)
+
+    def test_read_many_by_chunks(self):
+        records = self.api.read_many("res.partner", [5, 1, 5, 9, 2], chunk_size=2)
+        # The missing ids are left out, the repeated ids are read once
+        self.assertEqual(sorted(records), [1, 2, 5])
+        self.assertEqual(records[5], {"id": 5})
+        self.assertEqual(
+            [domain for (domain,), __ in self._get_calls()],
+            [[["id", "in", [5, 1]]], [["id", "in", [9, 2]]]],
+        )
+
+    def test_read_many_passive_records(self):
+        self.api.read_many("res.partner", [1], get_passive=True)
+        (domain,), __ = self._get_calls()[0]
+        self.assertEqual(
+            domain,
+            ["|", ["active", "=", True], ["active", "=", False], ["id", "in", [1]]],
+        )
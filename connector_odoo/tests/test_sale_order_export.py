@@ -0,0 +1,70 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from unittest import mock
+
+from .common import OdooConnectorCase
+
+
+class TestSaleOrderExport(OdooConnectorCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        partner = cls.env["res.partner"].create({"name": "Order Partner"})
+        product = cls.env["product.product"].create({"name": "Order Product"})
+        order = cls.env["sale.order"].create(
+            {
+                "partner_id": partner.id,
+                "order_line": [
+                    (0, 0, {"product_id": product.id, "product_uom_qty": qty})
+                    for qty in (1, 2, 3)
+                ],
+            }
+        )
+        cls.binding = cls.env["odoo.sale.order"].create(
+            {"backend_id": cls.backend.id, "odoo_id": order.id, "external_id": 10}
+        )
+        cls.line_bindings = cls.env["odoo.sale.order.line"].create(
+            [
+                {
+                    "backend_id": cls.backend.id,
+                    "odoo_id": line.id,
+                    "external_id": external_id,
+                }
+                for line, external_id in zip(order.order_line, (100, False, False))
+            ]
+        )
+
+    def _bind_order_lines(self, remote_line_ids):
+        """Bind the lines sent with the order, Odoo giving these lines
+
+        :return: the mock of the read of the order on Odoo
+        """
+        with self.backend.work_on("odoo.sale.order") as work:
+            exporter = work.component(usage="record.exporter")
+            exporter.binding = self.binding
+            exporter.external_id = 10
+            exporter._line_bindings = self.line_bindings
+            with mock.patch.object(
+                type(exporter.backend_adapter),
+                "read",
+                return_value={"order_line": remote_line_ids},
+            ) as read:
+                exporter._bind_order_lines()
+        return read
+
+    def test_new_lines_bound_in_order(self):
+        read = self._bind_order_lines([100, 205, 204])
+        read.assert_called_once_with(10, fields=["order_line"])
+        self.assertEqual(self.line_bindings.mapped("external_id"), [100, 204, 205])
+        self.assertTrue(all(self.line_bindings.mapped("sync_date")))
+
+    def test_lines_not_bound_on_count_mismatch(self):
+        self._bind_order_lines([100, 204])
+        self.assertEqual(self.line_bindings.mapped("external_id"), [100, 0, 0])
+        self.assertTrue(self.line_bindings[0].sync_date)
+
+    def test_bound_lines_not_read(self):
+        self.line_bindings[1].external_id = 101
+        self.line_bindings[2].external_id = 102
+        read = self._bind_order_lines([100, 101, 102])
+        read.assert_not_called()
+        self.assertTrue(all(self.line_bindings.mapped("sync_date")))